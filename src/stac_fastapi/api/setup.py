@@ -10,6 +10,7 @@ install_requires = [
     "pydantic[dotenv]",
     "stac_pydantic==2.0.*",
     "brotli_asgi",
+    "orjson>=3.9",
     "stac-fastapi.types",
 ]
 
@@ -2,7 +2,7 @@
 from typing import Any, Callable, Dict, List, Optional, Type, Union, Tuple
 
 import attr
-from brotli_asgi import BrotliMiddleware
+import orjson
 from fastapi import APIRouter, FastAPI
 from fastapi.openapi.models import OpenAPI
 from fastapi.openapi.utils import get_openapi
@@ -18,18 +18,30 @@ from stac_pydantic import Collection, Item, ItemCollection
 from stac_pydantic.api import ConformanceClasses, LandingPage, Search
 from stac_pydantic.api.collections import Collections
 from stac_pydantic.version import STAC_VERSION
+from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, JSONResponse, Response
-
-from stac_fastapi.api import descriptions
+from starlette.responses import HTMLResponse, Response
+
+from stac_fastapi.api.descriptions import (
+    CONFORMANCECLASSES,
+    GET_COLLECTION,
+    GET_COLLECTIONS,
+    GET_ITEM,
+    GET_ITEM_COLLECTION,
+    GET_SEARCH,
+    LANDING_PAGE,
+    POST_SEARCH,
+)
 from stac_fastapi.api.errors import DEFAULT_STATUS_CODES, add_exception_handlers
 from stac_fastapi.api.models import (
     APIRequest,
     CollectionUri,
     EmptyRequest,
     GeoJSONResponse,
+    GeoJSONStreamingResponse,
     ItemCollectionUri,
     ItemUri,
+    ORJSONResponse,
     SearchGetRequest,
     _create_request_model,
 )
@@ -41,7 +53,7 @@ from stac_fastapi.api.routes import (
 )
 
 # from stac_fastapi.api.openapi import VndResponse
-class VndResponse(JSONResponse):
+class VndResponse(ORJSONResponse):
     media_type = "application/vnd.oai.openapi+json;version=3.0"
 
 
@@ -54,13 +66,46 @@ from stac_fastapi.types.core import AsyncBaseCoreClient, BaseCoreClient
 from stac_fastapi.types.extension import ApiExtension
 from stac_fastapi.types.search import STACSearch
 
+# Core STAC endpoints as
+# (name, path, method, client method, request model, description, response model, response class).
+# A request model of None means the search request model of the StacApi instance, a response class
+# of None means `StacApi.response_class`.
+_CORE_ROUTES = [
+    ("Landing Page", "/", "GET", "landing_page", EmptyRequest, LANDING_PAGE, LandingPage, None),
+    ("Conformance Classes", "/conformance", "GET", "conformance", EmptyRequest, CONFORMANCECLASSES, ConformanceClasses, None),
+    ("Get Item", "/collections/{collectionId}/items/{itemId}", "GET", "get_item", ItemUri, GET_ITEM, Item, None),
+    ("Search", "/search", "POST", "post_search", None, POST_SEARCH, ItemCollection, GeoJSONResponse),
+    ("Search", "/search", "GET", "get_search", SearchGetRequest, GET_SEARCH, ItemCollection, GeoJSONResponse),
+    ("Get Collections", "/collections", "GET", "all_collections", EmptyRequest, GET_COLLECTIONS, Collections, None),
+    ("Get Collection", "/collections/{collectionId}", "GET", "get_collection", CollectionUri, GET_COLLECTION, Collection, None),
+    ("Get ItemCollection", "/collections/{collectionId}/items", "GET", "item_collection", ItemCollectionUri, GET_ITEM_COLLECTION, ItemCollection, GeoJSONStreamingResponse),
+]
+
+
+def _default_middlewares(api: "StacApi") -> List[Middleware]:
+    """Brotli compression, configured from `api`.
+
+    brotli_asgi is only imported when the default middlewares are used.
+    """
+    from brotli_asgi import BrotliMiddleware
+
+    return [
+        Middleware(
+            BrotliMiddleware,
+            quality=api.brotli_quality,
+            minimum_size=api.brotli_min_size,
+            gzip_fallback=True,
+        )
+    ]
+
 
 @attr.s
 class StacApi:
     """StacApi factory.
 
     Factory for creating a STAC-compliant FastAPI application.  After instantation, the application is accessible from
-    the `StacApi.app` attribute.
+    the `StacApi.app` attribute. Serve it with uvicorn using `--loop uvloop --http httptools`, or with gunicorn and
+    `uvicorn.workers.UvicornWorker` workers (see `stac_fastapi/sqlalchemy/gunicorn_conf.py`).
 
     Attributes:
         settings:
@@ -68,7 +113,8 @@ class StacApi:
             See https://pydantic-docs.helpmanual.io/usage/settings/.
         client:
             A subclass of `stac_api.clients.BaseCoreClient`.  Defines the application logic which is injected
-            into the API.
+            into the API. Client results are rendered directly by `response_class` without response model
+            validation, so clients must return fully-formed JSON-compatible dicts.
         extensions:
             API extensions to include with the application.  This may include official STAC extensions as well as
             third-party add ons.
@@ -77,13 +123,19 @@ class StacApi:
             certain exceptions (https://fastapi.tiangolo.com/tutorial/handling-errors/#install-custom-exception-handlers).
         app:
             The FastAPI application, defaults to a fresh application.
+        brotli_quality:
+            Brotli compression quality used by the default middleware.
+        brotli_min_size:
+            Responses smaller than this many bytes are not compressed by the default middleware.
+        middlewares:
+            Middleware classes or `starlette.middleware.Middleware` instances to add to the application.
     """
 
     settings: ApiSettings = attr.ib()
     client: Union[AsyncBaseCoreClient, BaseCoreClient] = attr.ib()
     extensions: List[ApiExtension] = attr.ib(default=attr.Factory(list))
     exceptions: Dict[Type[Exception], int] = attr.ib(
-        default=attr.Factory(lambda: DEFAULT_STATUS_CODES)
+        default=DEFAULT_STATUS_CODES, converter=dict
     )
     app: FastAPI = attr.ib(
         default=attr.Factory(
@@ -97,8 +149,13 @@ class StacApi:
     stac_version: str = attr.ib(default=STAC_VERSION)
     description: str = attr.ib(default="API til udstilling af metadata for ikke-oprettede flyfotos.")
     search_request_model: Type[Search] = attr.ib(default=STACSearch)
-    response_class: Type[Response] = attr.ib(default=JSONResponse)
-    middlewares: List = attr.ib(default=attr.Factory(lambda: [BrotliMiddleware]))
+    response_class: Type[Response] = attr.ib(default=ORJSONResponse)
+    brotli_quality: int = attr.ib(default=4)
+    brotli_min_size: int = attr.ib(default=1024)
+    middlewares: List = attr.ib(
+        default=attr.Factory(_default_middlewares, takes_self=True),
+        converter=list,
+    )
     route_dependencies: List[Tuple[List[Scope], List[Depends]]] = attr.ib(default=[])
 
     def get_extension(self, extension: Type[ApiExtension]) -> Optional[ApiExtension]:
@@ -110,10 +167,10 @@ class StacApi:
         Returns:
             The extension instance, if it exists.
         """
-        for ext in self.extensions:
-            if isinstance(ext, extension):
-                return ext
-        return None
+        # Fast path for the exact extension type, fall back to isinstance for subclasses
+        return self._ext_by_type.get(extension) or next(
+            (ext for ext in self.extensions if isinstance(ext, extension)), None
+        )
 
     def _create_endpoint(
         self,
@@ -128,169 +185,6 @@ class StacApi:
             return create_sync_endpoint(func, request_type, response_class=resp_class)
         raise NotImplementedError
 
-    def register_landing_page(self):
-        """Register landing page (GET /).
-
-        Returns:
-            None
-        """
-        self.router.add_api_route(
-            name="Landing Page",
-            path="/",
-            response_model=LandingPage
-            if self.settings.enable_response_models
-            else None,
-            response_class=self.response_class,
-            response_model_exclude_unset=False,
-            response_model_exclude_none=True,
-            methods=["GET"],
-            endpoint=self._create_endpoint(self.client.landing_page, EmptyRequest, self.response_class),
-            description=descriptions.LANDING_PAGE
-        )
-
-    def register_conformance_classes(self):
-        """Register conformance classes (GET /conformance).
-
-        Returns:
-            None
-        """
-        self.router.add_api_route(
-            name="Conformance Classes",
-            path="/conformance",
-            response_model=ConformanceClasses
-            if self.settings.enable_response_models
-            else None,
-            response_class=self.response_class,
-            response_model_exclude_unset=True,
-            response_model_exclude_none=True,
-            methods=["GET"],
-            endpoint=self._create_endpoint(self.client.conformance, EmptyRequest, self.response_class),
-            description=descriptions.CONFORMANCECLASSES
-        )
-
-    def register_get_item(self):
-        """Register get item endpoint (GET /collections/{collectionId}/items/{itemId}).
-
-        Returns:
-            None
-        """
-        self.router.add_api_route(
-            name="Get Item",
-            path="/collections/{collectionId}/items/{itemId}",
-            response_model=Item if self.settings.enable_response_models else None,
-            response_class=self.response_class,
-            response_model_exclude_unset=True,
-            response_model_exclude_none=True,
-            methods=["GET"],
-            endpoint=self._create_endpoint(self.client.get_item, ItemUri, self.response_class),
-            description=descriptions.GET_ITEM
-        )
-
-    def register_post_search(self):
-        """Register search endpoint (POST /search).
-
-        Returns:
-            None
-        """
-        search_request_model = _create_request_model(self.search_request_model)
-        fields_ext = self.get_extension(FieldsExtension)
-        self.router.add_api_route(
-            name="Search",
-            path="/search",
-            response_model=(ItemCollection if not fields_ext else None)
-            if self.settings.enable_response_models
-            else None,
-            response_class=GeoJSONResponse,
-            response_model_exclude_unset=True,
-            response_model_exclude_none=True,
-            methods=["POST"],
-            endpoint=self._create_endpoint(
-                self.client.post_search, search_request_model, GeoJSONResponse
-            ),
-            description=descriptions.POST_SEARCH
-        )
-
-    def register_get_search(self):
-        """Register search endpoint (GET /search).
-
-        Returns:
-            None
-        """
-        fields_ext = self.get_extension(FieldsExtension)
-        self.router.add_api_route(
-            name="Search",
-            path="/search",
-            response_model=(ItemCollection if not fields_ext else None)
-            if self.settings.enable_response_models
-            else None,
-            response_class=GeoJSONResponse,
-            response_model_exclude_unset=True,
-            response_model_exclude_none=True,
-            methods=["GET"],
-            endpoint=self._create_endpoint(self.client.get_search, SearchGetRequest, GeoJSONResponse),
-            description=descriptions.GET_SEARCH
-        )
-
-    def register_get_collections(self):
-        """Register get collections endpoint (GET /collections).
-
-        Returns:
-            None
-        """
-        self.router.add_api_route(
-            name="Get Collections",
-            path="/collections",
-            response_model=Collections
-            if self.settings.enable_response_models
-            else None,
-            response_class=self.response_class,
-            response_model_exclude_unset=True,
-            response_model_exclude_none=True,
-            methods=["GET"],
-            endpoint=self._create_endpoint(self.client.all_collections, EmptyRequest, self.response_class),
-            description=descriptions.GET_COLLECTIONS
-        )
-
-    def register_get_collection(self):
-        """Register get collection endpoint (GET /collection/{collectionId}).
-
-        Returns:
-            None
-        """
-        self.router.add_api_route(
-            name="Get Collection",
-            path="/collections/{collectionId}",
-            response_model=Collection if self.settings.enable_response_models else None,
-            response_class=self.response_class,
-            response_model_exclude_unset=True,
-            response_model_exclude_none=True,
-            methods=["GET"],
-            endpoint=self._create_endpoint(self.client.get_collection, CollectionUri, self.response_class),
-            description=descriptions.GET_COLLECTION
-        )
-
-    def register_get_item_collection(self):
-        """Register get item collection endpoint (GET /collection/{collectionId}/items).
-
-        Returns:
-            None
-        """
-        self.router.add_api_route(
-            name="Get ItemCollection",
-            path="/collections/{collectionId}/items",
-            response_model=ItemCollection
-            if self.settings.enable_response_models
-            else None,
-            response_class=self.response_class,
-            response_model_exclude_unset=True,
-            response_model_exclude_none=True,
-            methods=["GET"],
-            endpoint=self._create_endpoint(
-                self.client.item_collection, ItemCollectionUri, self.response_class
-            ),
-            description=descriptions.GET_ITEM_COLLECTION
-        )
-
     def register_core(self):
         """Register core STAC endpoints.
 
@@ -308,14 +202,36 @@ class StacApi:
         Returns:
             None
         """
-        self.register_landing_page()
-        self.register_conformance_classes()
-        self.register_get_item()
-        self.register_post_search()
-        self.register_get_search()
-        self.register_get_collections()
-        self.register_get_collection()
-        self.register_get_item_collection()
+        fields_ext = self.get_extension(FieldsExtension)
+        _add = self.router.add_api_route
+        for (
+            name,
+            path,
+            method,
+            client_method,
+            request_model,
+            description,
+            response_model,
+            response_class,
+        ) in _CORE_ROUTES:
+            if request_model is None:
+                request_model = _create_request_model(self.search_request_model)
+            response_class = response_class or self.response_class
+            # The fields extension allows search responses which are not valid item collections
+            if not self.settings.enable_response_models or (fields_ext and path == "/search"):
+                response_model = None
+            _add(
+                name=name,
+                path=path,
+                response_model=None,
+                responses={200: {"model": response_model}} if response_model else None,
+                response_class=response_class,
+                methods=[method],
+                endpoint=self._create_endpoint(
+                    getattr(self.client, client_method), request_model, response_class
+                ),
+                description=description,
+            )
 
     def customize_openapi(self) -> Optional[Dict[str, Any]]:
         """Customize openapi schema."""
@@ -362,22 +278,28 @@ class StacApi:
             if self.openapi_url:
                 urls = (server_data.get("url") for server_data in self.servers)
                 server_urls = {url for url in urls if url}
+                # The schema is static once built, so render it to bytes on the first hit only
+                openapi_bytes: Optional[bytes] = None
 
-                async def openapi(req: Request) -> VndResponse:
+                async def openapi(req: Request) -> Response:
+                    nonlocal openapi_bytes
                     root_path = req.scope.get("root_path", "").rstrip("/")
                     if root_path not in server_urls:
                         if root_path and self.root_path_in_servers:
                             self.servers.insert(0, {"url": root_path})
                             server_urls.add(root_path)
 
+                    if openapi_bytes is None:
+                        openapi_bytes = orjson.dumps(self.openapi())
+
                     # This is the response we have changed
                     if (
                         "application/vnd.oai.openapi;version=3.0"
-                        in req.headers["accept"]
+                        in req.headers.get("accept", "")
                     ):
-                        return VndResponse(self.openapi())
+                        return Response(openapi_bytes, media_type=VndResponse.media_type)
                     else:
-                        return JSONResponse(self.openapi())
+                        return Response(openapi_bytes, media_type="application/json")
 
                 self.add_route(self.openapi_url, openapi, include_in_schema=False)
 
@@ -436,6 +358,8 @@ class StacApi:
         Returns:
             None
         """
+        self._ext_by_type = {type(ext): ext for ext in self.extensions}
+
         # inject settings
         self.client.extensions = self.extensions
         self.client.stac_version = self.stac_version
@@ -449,6 +373,13 @@ class StacApi:
         Settings.set(self.settings)
         self.app.state.settings = self.settings
 
+        # add middlewares, in the same order as repeated `add_middleware` calls: the last middleware
+        # is the outermost. Starlette rebuilds the middleware stack when the exception handlers are added
+        self.app.user_middleware[0:0] = [
+            m if isinstance(m, Middleware) else Middleware(m)
+            for m in reversed(self.middlewares)
+        ]
+
         # Register core STAC endpoints
         self.register_core()
         self.app.include_router(self.router)
@@ -466,10 +397,6 @@ class StacApi:
         # customize openapi
         self.app.openapi = self.customize_openapi
 
-        # add middlewares
-        for middleware in self.middlewares:
-            self.app.add_middleware(middleware)
-
         # customize route dependencies
         for scopes, dependencies in self.route_dependencies:
             self.add_route_dependencies(scopes=scopes, dependencies=dependencies)
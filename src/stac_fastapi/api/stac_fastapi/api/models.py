@@ -1,185 +1,291 @@
 """api request/response models."""
 
-import importlib.util
 import abc
-from typing import Dict, Optional, Type, Union, List
+import functools
+import itertools
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, Union, List
 from datetime import datetime
+from uuid import UUID
 import attr
+import orjson
 from fastapi import Body, Path, Query, Response
 from pydantic import BaseModel, create_model
-from pydantic.fields import UndefinedType
+from pydantic.fields import FieldInfo, UndefinedType
+from starlette.responses import JSONResponse, StreamingResponse
+
+from stac_fastapi.types.errors import InvalidQueryParameter
 from . import descriptions
 
 NumType = Union[int, float]
 
 
+def _body_from_field_info(field_info: FieldInfo) -> FieldInfo:
+    """Create a request body parameter mirroring a pydantic field."""
+    return Body(
+        None
+        if isinstance(field_info.default, UndefinedType)
+        else field_info.default,
+        default_factory=field_info.default_factory,
+        alias=field_info.alias,
+        alias_priority=field_info.alias_priority,
+        title=field_info.title,
+        description=field_info.description,
+        const=field_info.const,
+        gt=field_info.gt,
+        ge=field_info.ge,
+        lt=field_info.lt,
+        le=field_info.le,
+        multiple_of=field_info.multiple_of,
+        min_items=field_info.min_items,
+        max_items=field_info.max_items,
+        min_length=field_info.min_length,
+        max_length=field_info.max_length,
+        regex=field_info.regex,
+        extra=field_info.extra,
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def _create_request_model(model: Type[BaseModel]) -> Type[BaseModel]:
-    """Create a pydantic model for validating request bodies."""
-    fields = {}
-    for (k, v) in model.__fields__.items():
-        # TODO: Filter out fields based on which extensions are present
-        field_info = v.field_info
-        body = Body(
-            None
-            if isinstance(field_info.default, UndefinedType)
-            else field_info.default,
-            default_factory=field_info.default_factory,
-            alias=field_info.alias,
-            alias_priority=field_info.alias_priority,
-            title=field_info.title,
-            description=field_info.description,
-            const=field_info.const,
-            gt=field_info.gt,
-            ge=field_info.ge,
-            lt=field_info.lt,
-            le=field_info.le,
-            multiple_of=field_info.multiple_of,
-            min_items=field_info.min_items,
-            max_items=field_info.max_items,
-            min_length=field_info.min_length,
-            max_length=field_info.max_length,
-            regex=field_info.regex,
-            extra=field_info.extra,
-        )
-        fields[k] = (v.outer_type_, body)
+    """Create a pydantic model for validating request bodies.
+
+    The result is cached per model class, so repeated calls return the same request model.
+    """
+    # TODO: Filter out fields based on which extensions are present
+    fields = {
+        k: (v.outer_type_, _body_from_field_info(v.field_info))
+        for (k, v) in model.__fields__.items()
+    }
     return create_model(model.__name__, **fields, __base__=model)
 
 
-@attr.s  # type:ignore
+def _identity(value: Any) -> Any:
+    """Pass the value through unchanged."""
+    return value
+
+
+# str.split and float() already scan in C. bytes.split plus decoding, and numpy parsing of bbox,
+# both measured slower for these inputs, even for ids lists with thousands of entries.
+def _csv(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma separated query parameter, passing empty values through."""
+    return value.split(",") if value else value
+
+
+def _csv_floats(value: Optional[str]) -> Optional[Tuple[float, ...]]:
+    """Parse a comma separated query parameter of numbers, eg. `bbox`."""
+    if not value:
+        return value
+    try:
+        return tuple(map(float, value.split(",")))
+    except ValueError:
+        raise InvalidQueryParameter(f"Invalid number in '{value}'")
+
+
+# Parameter declarations shared by all request models, so each parameter is declared once
+_P_COLLECTION_ID = Path(..., description=descriptions.COLLECTION_ID)
+_P_ITEM_ID = Path(..., description=descriptions.ITEM_ID)
+_Q_CRS = Query(None, description=descriptions.CRS)
+_Q_LIMIT = Query(10, description=descriptions.LIMIT)
+_Q_PT = Query(None, description=descriptions.PAGING_TOKEN)
+_Q_IDS = Query(None, description=descriptions.IDS)
+_Q_BBOX = Query(None, description=descriptions.BBOX)
+_Q_BBOX_CRS = Query(None, alias="bbox-crs", description=descriptions.BBOX_CRS)
+_Q_DATETIME = Query(None, description=descriptions.DATETIME)
+_Q_FILTER = Query(None, description=descriptions.FILTER)
+_Q_FILTER_LANG = Query(None, alias="filter-lang", description=descriptions.FILTER_LANG)
+_Q_FILTER_CRS = Query(None, alias="filter-crs", description=descriptions.FILTER_CRS)
+_Q_COLLECTIONS = Query(None, description=descriptions.COLLECTIONS)
+_Q_SORTBY = Query(None, description=descriptions.SORTBY)
+_Q_INTERSECTS = Query(None, description=descriptions.INTERSECTS)
+
+
+@attr.s(slots=True, frozen=True, weakref_slot=False)  # type:ignore
 class APIRequest(abc.ABC):
-    """Generic API Request base class."""
+    """Generic API Request base class.
+
+    Subclasses list their parameters in `_KWARG_FIELDS` as (keyword, attribute, converter) tuples.
+    """
+
+    _KWARG_FIELDS: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = ()
 
-    @abc.abstractmethod
     def kwargs(self) -> Dict:
         """Transform api request params into format which matches the signature of the endpoint."""
-        ...
+        return {out: fn(getattr(self, src)) for out, src, fn in self._KWARG_FIELDS}
 
 
-@attr.s  # type:ignore
+@attr.s(slots=True, frozen=True, cache_hash=True)  # type:ignore
 class CollectionUri(APIRequest):
     """Delete collection."""
 
-    collectionId: str = attr.ib(default=Path(..., description=descriptions.COLLECTION_ID))
+    collectionId: str = attr.ib(default=_P_COLLECTION_ID)
 
-    def kwargs(self) -> Dict:
-        """kwargs."""
-        return {"id": self.collectionId}
+    _KWARG_FIELDS = (("id", "collectionId", _identity),)
 
 
-@attr.s
+@attr.s(slots=True, frozen=True, cache_hash=True)
 class ItemUri(CollectionUri):
     """Delete item."""
 
-    itemId: str = attr.ib(default=Path(..., description=descriptions.ITEM_ID))
-    crs: Optional[str] = attr.ib(default=Query(None, description=descriptions.CRS))
+    itemId: str = attr.ib(default=_P_ITEM_ID)
+    crs: Optional[str] = attr.ib(default=_Q_CRS)
 
-    def kwargs(self) -> Dict:
-        """kwargs."""
-        return {
-            "collection_id": self.collectionId,
-            "item_id": self.itemId,
-            "crs": self.crs,
-        }
+    _KWARG_FIELDS = (
+        ("collection_id", "collectionId", _identity),
+        ("item_id", "itemId", _identity),
+        ("crs", "crs", _identity),
+    )
 
 
-@attr.s
+@attr.s(slots=True, frozen=True, cache_hash=True)
 class EmptyRequest(APIRequest):
     """Empty request."""
 
-    def kwargs(self) -> Dict:
-        """kwargs."""
-        return {}
 
-
-@attr.s
+@attr.s(slots=True, frozen=True, weakref_slot=False)
 class FilterableRequest:
-    crs: Optional[str] = attr.ib(default=Query(None, description=descriptions.CRS))
-    limit: int = attr.ib(default=Query(10, description=descriptions.LIMIT))
-    pt: Optional[str] = attr.ib(default=Query(None, description=descriptions.PAGING_TOKEN))
-    ids: Optional[str] = attr.ib(default=Query(None, description=descriptions.IDS))
-    bbox: Optional[str] = attr.ib(default=Query(None, description=descriptions.BBOX))
-    bbox_crs: Optional[str] = attr.ib(default=Query(default=None, alias="bbox-crs", description=descriptions.BBOX_CRS))
-    datetime: Optional[str] = attr.ib(default=Query(None, description=descriptions.DATETIME))  # TODO: fix types
-    filter: Optional[str] = attr.ib(default=Query(None, description=descriptions.FILTER))
-    filter_lang: Optional[str] = attr.ib(
-        default=Query(default=None, alias="filter-lang", description=descriptions.FILTER_LANG)
-    )
-    filter_crs: Optional[str] = attr.ib(default=Query(default=None, alias="filter-crs", description=descriptions.FILTER_CRS))
+    crs: Optional[str] = attr.ib(default=_Q_CRS)
+    limit: int = attr.ib(default=_Q_LIMIT)
+    pt: Optional[str] = attr.ib(default=_Q_PT)
+    ids: Optional[str] = attr.ib(default=_Q_IDS)
+    bbox: Optional[str] = attr.ib(default=_Q_BBOX)
+    bbox_crs: Optional[str] = attr.ib(default=_Q_BBOX_CRS)
+    datetime: Optional[str] = attr.ib(default=_Q_DATETIME)  # TODO: fix types
+    filter: Optional[str] = attr.ib(default=_Q_FILTER)
+    filter_lang: Optional[str] = attr.ib(default=_Q_FILTER_LANG)
+    filter_crs: Optional[str] = attr.ib(default=_Q_FILTER_CRS)
+
+
+@attr.s(slots=True, frozen=True, cache_hash=True)
+class ItemCollectionUri(APIRequest, FilterableRequest):
+    """Get item collection."""
 
+    # not inherited from CollectionUri: slotted bases with fields cannot be combined
+    collectionId: str = attr.ib(default=_P_COLLECTION_ID)
+
+    _KWARG_FIELDS = (
+        ("id", "collectionId", _identity),
+        ("ids", "ids", _csv),
+        ("bbox", "bbox", _csv_floats),
+        ("bbox_crs", "bbox_crs", _identity),
+        ("datetime", "datetime", _identity),
+        ("crs", "crs", _identity),
+        ("filter", "filter", _identity),
+        ("filter_lang", "filter_lang", _identity),
+        ("filter_crs", "filter_crs", _identity),
+        ("limit", "limit", _identity),
+        ("pt", "pt", _identity),
+    )
 
-@attr.s
-class ItemCollectionUri(CollectionUri, FilterableRequest):
-    """Get item collection."""
 
-    def kwargs(self) -> Dict:
-        """kwargs."""
-        return {
-            "id": self.collectionId,
-            "ids": self.ids.split(",") if self.ids else self.ids,
-            "bbox": self.bbox,
-            "bbox_crs": self.bbox_crs,
-            "datetime": self.datetime,
-            "crs": self.crs,
-            "filter": self.filter,
-            "filter_lang": self.filter_lang,
-            "filter_crs": self.filter_crs,
-            "limit": self.limit,
-            "pt": self.pt,
-        }
-
-
-@attr.s
+@attr.s(slots=True, frozen=True, cache_hash=True)
 class SearchGetRequest(APIRequest, FilterableRequest):
     """GET search request."""
 
-    collections: Optional[str] = attr.ib(default=Query(None, description=descriptions.COLLECTIONS))
+    collections: Optional[str] = attr.ib(default=_Q_COLLECTIONS)
     # fields: Optional[str] = attr.ib(default=None)
-    sortby: Optional[str] = attr.ib(default=Query(None, description=descriptions.SORTBY))
-    intersects: Optional[str] = attr.ib(default=Query(None, description=descriptions.INTERSECTS))
+    sortby: Optional[str] = attr.ib(default=_Q_SORTBY)
+    intersects: Optional[str] = attr.ib(default=_Q_INTERSECTS)
+
+    # there is an important semantic difference between request with and empty fields param and not specifying fields at all ("url?fields=" versus "url").
+    # In the first case the Fields extension specifies that only a minimal subset of properties should be returned3
+    # and in the latter case (no "fields" param specified) all properties should be returned.
+    # if self.fields is not None:
+    #     fields = self.fields.split(",") if len(self.fields) > 0 else []
+    # else:
+    #     fields = self.fields
+    _KWARG_FIELDS = (
+        ("collections", "collections", _csv),
+        ("ids", "ids", _csv),
+        ("bbox", "bbox", _csv_floats),
+        ("bbox_crs", "bbox_crs", _identity),
+        ("datetime", "datetime", _identity),
+        ("limit", "limit", _identity),
+        ("filter", "filter", _identity),
+        ("filter_lang", "filter_lang", _identity),
+        ("filter_crs", "filter_crs", _identity),
+        # ("query", "query", _identity),
+        ("pt", "pt", _identity),
+        # ("fields", "fields", ...),
+        ("crs", "crs", _identity),
+        ("sortby", "sortby", _csv),
+        ("intersects", "intersects", _identity),
+    )
 
-    def kwargs(self) -> Dict:
-        """kwargs."""
-
-        # there is an important semantic difference between request with and empty fields param and not specifying fields at all ("url?fields=" versus "url").
-        # In the first case the Fields extension specifies that only a minimal subset of properties should be returned3
-        # and in the latter case (no "fields" param specified) all properties should be returned.
-        # if self.fields is not None:
-        #     fields = self.fields.split(",") if len(self.fields) > 0 else []
-        # else:
-        #     fields = self.fields
-        return {
-            "collections": self.collections.split(",")
-            if self.collections
-            else self.collections,
-            "ids": self.ids.split(",") if self.ids else self.ids,
-            "bbox": self.bbox.split(",") if self.bbox else self.bbox,
-            "bbox_crs": self.bbox_crs,
-            "datetime": self.datetime,
-            "limit": self.limit,
-            "filter": self.filter,
-            "filter_lang": self.filter_lang,
-            "filter_crs": self.filter_crs,
-            # "query": self.query,
-            "pt": self.pt,
-            # "fields": fields,
-            "crs": self.crs,
-            "sortby": self.sortby.split(",") if self.sortby else self.sortby,
-            "intersects": self.intersects
-        }
-
-# Test for ORJSON and use it rather than stdlib JSON where supported
-if importlib.util.find_spec("orjson") is not None:
-    from fastapi.responses import ORJSONResponse
-
-    class GeoJSONResponse(ORJSONResponse):
-        """JSON with custom, vendor content-type."""
-
-        media_type = "application/geo+json"
-
-else:
-    from starlette.responses import JSONResponse
-
-    class GeoJSONResponse(JSONResponse):
-        """JSON with custom, vendor content-type."""
-
-        media_type = "application/geo+json"
\ No newline at end of file
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.dict(exclude_none=True)
+    raise TypeError
+
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered directly to bytes by orjson.
+
+    Parts of the content which are already serialized (eg. JSON read from the database) can be
+    wrapped in `orjson.Fragment` and are then copied into the response as is.
+
+    Top level members which are None are left out, as `response_model_exclude_none` would have done.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Render content."""
+        if isinstance(content, dict):
+            content = {k: v for k, v in content.items() if v is not None}
+        return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+
+class GeoJSONResponse(ORJSONResponse):
+    """JSON with custom, vendor content-type."""
+
+    media_type = "application/geo+json"
+
+
+# Features encoded per chunk. Each chunk is one trip to the threadpool
+_STREAM_BATCH_SIZE = 100
+
+
+def _iter_feature_collection(content: Dict) -> Iterator[bytes]:
+    """Encode a FeatureCollection in chunks of `_STREAM_BATCH_SIZE` features.
+
+    `features` may be any iterable, members other than `type` and `features` are written after the features
+    and left out if None.
+
+    A plain generator, so `StreamingResponse` runs the encoding in the threadpool and not on the event loop.
+    """
+    yield b'{"type":"FeatureCollection","features":['
+    features = iter(content["features"])
+    sep = b""
+    while True:
+        batch = [
+            orjson.dumps(feature, default=_orjson_default, option=_ORJSON_OPTIONS)
+            for feature in itertools.islice(features, _STREAM_BATCH_SIZE)
+        ]
+        if not batch:
+            break
+        yield sep + b",".join(batch)
+        sep = b","
+    yield b"]"
+    for key, value in content.items():
+        if value is not None and key not in ("type", "features"):
+            yield b"," + orjson.dumps(key) + b":" + orjson.dumps(
+                value, default=_orjson_default, option=_ORJSON_OPTIONS
+            )
+    yield b"}"
+
+
+class GeoJSONStreamingResponse(StreamingResponse, GeoJSONResponse):
+    """FeatureCollection streamed in batches of features, so the whole collection is never encoded at once.
+
+    Inherits `GeoJSONResponse` for the media type and so FastAPI documents the response as JSON.
+    """
+
+    def __init__(self, content: Dict, status_code: int = 200, **kwargs) -> None:
+        super().__init__(_iter_feature_collection(content), status_code=status_code, **kwargs)
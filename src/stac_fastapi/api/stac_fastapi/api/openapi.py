@@ -4,10 +4,10 @@ from fastapi.openapi.utils import get_openapi
 
 from stac_fastapi.api.config import ApiExtensions
 from stac_fastapi.types.config import ApiSettings
-from fastapi.responses import JSONResponse
+from stac_fastapi.api.models import ORJSONResponse
 
 
-class VndResponse(JSONResponse):
+class VndResponse(ORJSONResponse):
     media_type = "application/vnd.oai.openapi+json;version=3.0"
 
 # TODO: Remove or fix, this is currently unused
@@ -1,20 +1,33 @@
-from typing import Callable
+import copy
+from typing import Callable, Optional
 
+import orjson
 from fastapi.applications import FastAPI
 from fastapi.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
+from stac_fastapi.api.models import ORJSONResponse
 
-class VndResponse(JSONResponse):
+
+class VndResponse(ORJSONResponse):
     media_type = "application/vnd.oai.openapi+json;version=3.0"
 
 
-def get_openapi_handler(app: FastAPI) -> Callable[[Request], VndResponse]:
+def get_openapi_handler(app: FastAPI) -> Callable[[Request], Response]:
+    # The definition is static, so it is built and rendered on the first request only
+    definition_bytes: Optional[bytes] = None
+
     def handler(req: Request):
+        nonlocal definition_bytes
+        if definition_bytes is None:
+            definition_bytes = orjson.dumps(build_definition())
+        return Response(definition_bytes, media_type=VndResponse.media_type)
 
+    def build_definition():
         # OpenAPI spec must be modified because FastAPI doesn't support
         # encoding style: https://github.com/tiangolo/fastapi/issues/283
-        definition = app.openapi().copy()
+        # Deep copy, the schema of the app itself must not be modified
+        definition = copy.deepcopy(app.openapi())
         # Delete bogus components that are not OGC compliant
         for component in list(definition["components"]["schemas"].keys()):
             if component not in ["HTTPValidationError", "ValidationError"]:
@@ -52,6 +65,6 @@ def get_openapi_handler(app: FastAPI) -> Callable[[Request], VndResponse]:
             },
         }
 
-        return VndResponse(definition)
+        return definition
 
     return handler
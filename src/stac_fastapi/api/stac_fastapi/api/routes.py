@@ -12,10 +12,16 @@ from stac_fastapi.api.models import APIRequest
 
 
 def _wrap_response(resp: Any, response_class: Type[Response]) -> Response:
+    """Render the client result with `response_class`.
+
+    Endpoints always return a `Response`, so FastAPI never runs the result through
+    `jsonable_encoder` or response model validation. Clients must therefore return
+    fully-formed, JSON-compatible dicts (or a `Response` of their own).
+    """
     if isinstance(resp, Response):
         return resp
     else:
-        return response_class(resp)
+        return response_class(content=resp)
 
 
 def create_async_endpoint(
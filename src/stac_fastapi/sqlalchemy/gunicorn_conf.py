@@ -0,0 +1,18 @@
+"""Gunicorn configuration.
+
+Runs the API in uvicorn workers (uvloop event loop + httptools HTTP parser):
+
+    gunicorn -c gunicorn_conf.py stac_fastapi.sqlalchemy.app:app
+"""
+import os
+
+from stac_fastapi.sqlalchemy.config import SqlalchemySettings
+
+bind = f"{os.environ.get('APP_HOST', '0.0.0.0')}:{os.environ.get('APP_PORT', '8081')}"
+# WEB_CONCURRENCY, or 2 * cpu count + 1 capped so the connection pools fit in DB_MAX_CONNECTIONS
+workers = SqlalchemySettings().workers
+worker_class = "uvicorn.workers.UvicornWorker"
+# Import the app once in the master. The database engine is created lazily, so each
+# worker still opens its own connection pool after the fork.
+preload_app = True
+keepalive = 65
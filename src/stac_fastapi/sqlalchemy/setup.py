@@ -12,6 +12,7 @@ install_requires = [
     "stac-fastapi.types",
     "stac-fastapi.api",
     "stac-fastapi.extensions",
+    "orjson>=3.9",
     "sqlakeyset",
     "geoalchemy2<0.8.0",
     "sqlalchemy==1.3.23",
@@ -33,7 +34,7 @@ extra_reqs = {
         "pytest-dotenv",
     ],
     "docs": ["mkdocs", "mkdocs-material", "pdocs"],
-    "server": ["uvicorn[standard]>=0.12.0,<0.14.0"],
+    "server": ["uvicorn[standard]>=0.12.0,<0.14.0", "gunicorn"],
 }
 
 
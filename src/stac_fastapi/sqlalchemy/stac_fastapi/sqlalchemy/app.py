@@ -86,7 +86,11 @@ api = StacApi(
     settings=settings,
     extensions=[
         # FieldsExtension(),
-        FilterExtension(client=CoreFiltersClient(session=session)),
+        FilterExtension(
+            client=CoreFiltersClient(
+                session=session, cache_ttl=settings.response_cache_ttl
+            )
+        ),
         SortExtension(),
         ContextExtension(),
         CrsExtension(),
@@ -95,6 +99,7 @@ api = StacApi(
         session=session,
         collection_table=database.Collection,
         landing_page_id="dataforsyningen-flyfotoapi",
+        cache_ttl=settings.response_cache_ttl,
     ),
     search_request_model=STACSearch,
     route_dependencies=[(ROUTES_REQUIRING_TOKEN, [Depends(token_header_param), Depends(token_query_param)])],
@@ -116,3 +121,36 @@ if settings.debug:
         logging.debug(request.headers)
         response = await call_next(request)
         return response
+
+
+def run():
+    """Run app from command line using uvicorn if available.
+
+    Uses the uvloop event loop and the httptools HTTP parser, and `settings.workers` workers
+    (see `SqlalchemySettings.workers`). With `reload` uvicorn serves a single process. For
+    production deployments prefer gunicorn with `gunicorn_conf.py`, which runs the same uvicorn workers.
+    """
+    try:
+        import uvicorn
+
+        # uvicorn ignores, and warns about, workers together with reload
+        workers = {} if settings.reload else {"workers": settings.workers}
+        uvicorn.run(
+            "stac_fastapi.sqlalchemy.app:app",
+            host=settings.app_host,
+            port=settings.app_port,
+            log_level="info",
+            reload=settings.reload,
+            loop="uvloop",
+            http="httptools",
+            interface="asgi3",
+            proxy_headers=True,
+            timeout_keep_alive=65,
+            **workers,
+        )
+    except ImportError:
+        raise RuntimeError("Uvicorn must be installed in order to use command")
+
+
+if __name__ == "__main__":
+    run()
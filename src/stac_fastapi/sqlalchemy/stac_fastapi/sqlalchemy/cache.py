@@ -0,0 +1,43 @@
+"""In-process response cache."""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import attr
+
+
+@attr.s
+class TTLCache:
+    """Cache whose entries expire `ttl` seconds after they were stored.
+
+    A `ttl` of 0 disables caching. When `maxsize` is reached expired entries are dropped, then the oldest.
+
+    The sync endpoints run in a threadpool, so the entries are guarded by a lock. The lock is not held
+    while `factory` runs, concurrent misses for the same key may both call it.
+    """
+
+    ttl: float = attr.ib(default=60)
+    maxsize: int = attr.ib(default=256)
+    _entries: Dict[Hashable, Tuple[float, Any]] = attr.ib(init=False, factory=dict, repr=False)
+    _lock: threading.Lock = attr.ib(init=False, factory=threading.Lock, repr=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Get the cached value for `key`, calling `factory` to create it if missing or expired."""
+        if self.ttl <= 0:
+            return factory()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        value = factory()
+        with self._lock:
+            # Re-inserted, so an expired entry being refreshed becomes the newest
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                self._entries = {k: e for k, e in self._entries.items() if e[0] > now}
+                if len(self._entries) >= self.maxsize:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (now + self.ttl, value)
+        return value
@@ -1,5 +1,6 @@
 """Postgres API configuration."""
-from typing import Set
+import os
+from typing import Optional, Set
 
 from stac_fastapi.types.config import ApiSettings
 from enum import auto
@@ -26,9 +27,31 @@ class SqlalchemySettings(ApiSettings):
     # Fields which are item properties but indexed as distinct fields in the database model
     indexed_fields: Set[str] = {"datetime"}
     connect_args: dict = {}
+    # Connection pool. Sync endpoints run in a thread pool, size the pool for the number of worker threads
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800
+    # Every worker process has its own pool. The default number of workers is capped so that
+    # workers * (db_pool_size + db_max_overflow) stays within db_max_connections
+    db_max_connections: int = 100
+    # Number of worker processes, read from WEB_CONCURRENCY
+    web_concurrency: Optional[int] = None
 
     enable_response_models: bool = True
+    # Seconds collection and queryables responses are cached in-process, 0 disables the cache
+    response_cache_ttl: float = 60
     
+    @property
+    def workers(self) -> int:
+        """Number of worker processes to serve the API with.
+
+        `WEB_CONCURRENCY` when set, otherwise 2 * cpu count + 1 capped by the connection budget.
+        """
+        if self.web_concurrency:
+            return self.web_concurrency
+        per_worker = self.db_pool_size + self.db_max_overflow
+        return max(1, min(2 * (os.cpu_count() or 1) + 1, self.db_max_connections // per_worker))
+
     @property
     def connection_string(self):
         """Create psql connection string."""
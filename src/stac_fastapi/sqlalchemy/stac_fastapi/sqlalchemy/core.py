@@ -1,9 +1,10 @@
 """Item crud client."""
-import json
+import orjson
 import cProfile
 import io
 import pstats
 import contextlib
+from types import MappingProxyType
 from datetime import datetime
 from typing import List, Optional, Set, Type, Union, Dict, Any
 from urllib.parse import urljoin
@@ -13,20 +14,20 @@ import geoalchemy2 as ga
 import sqlalchemy as sa
 from sqlalchemy.sql.expression import true
 from sqlalchemy import and_
-import stac_pydantic
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import ValidationError
-from shapely.geometry import Polygon as ShapelyPolygon
 from shapely.geometry import shape
 from sqlakeyset import get_page
 from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import array
-from sqlalchemy.orm import Session as SqlSession, with_expression
+from sqlalchemy.orm import Session as SqlSession, defer, with_expression
 from stac_pydantic.links import Relations
 from stac_pydantic.shared import MimeTypes
 
+from stac_fastapi.api.models import GeoJSONStreamingResponse, ORJSONResponse
 from stac_fastapi.sqlalchemy import serializers
+from stac_fastapi.sqlalchemy.cache import TTLCache
 from stac_fastapi.sqlalchemy.models import database
 from stac_fastapi.sqlalchemy.session import Session
 from stac_fastapi.sqlalchemy.pagination import PaginationTokenClient
@@ -47,6 +48,18 @@ import pygeofilter
 
 NumType = Union[float, int]
 
+# Queryable name -> column expression, used to translate filters
+_FIELD_MAPPING = MappingProxyType(
+    {q: database.ImageView.get_field(q) for q in Queryables.get_all_queryables()}
+)
+# Queryable name -> (_, type, description, $ref) from QueryableInfo, used to build queryables schemas
+_QUERYABLE_INFO = MappingProxyType(
+    {
+        q: getattr(QueryableInfo, Queryables.get_queryable(q).name)
+        for q in Queryables.get_all_queryables()
+    }
+)
+
 
 @contextlib.contextmanager
 def profiled():
@@ -62,6 +75,32 @@ def profiled():
     print(s.getvalue())
 
 
+def _apply_fields(feat: Dict, include: Dict, exclude: Dict) -> Dict:
+    """Prune a serialized item by the include/exclude expressions of `FieldsExtension.filter_fields`.
+
+    Values in the expressions are either `...` for a whole member or a set of keys of a nested member,
+    eg. `{"properties": {"gsd"}}` for `properties.gsd`. An empty include keeps all members.
+    """
+    if include:
+        pruned = {}
+        for key, keys in include.items():
+            if key not in feat:
+                continue
+            value = feat[key]
+            if keys is not ... and isinstance(value, dict):
+                value = {k: v for k, v in value.items() if k in keys}
+            pruned[key] = value
+        feat = pruned
+    for key, keys in exclude.items():
+        if key not in feat:
+            continue
+        if keys is ...:
+            del feat[key]
+        elif isinstance(feat[key], dict):
+            feat[key] = {k: v for k, v in feat[key].items() if k not in keys}
+    return feat
+
+
 def monkeypatch_parse_geometry(geom):
     wkt = shape(geom).wkt
     crs = geom["crs"] if "crs" in geom.keys() else 4326
@@ -71,6 +110,10 @@ def monkeypatch_parse_geometry(geom):
         return func.ST_Transform(func.ST_GeomFromText(wkt, crs), 4326)
 
 
+# monkey patch parse_geometry from pygeofilter, once for all requests
+pygeofilter.backends.sqlalchemy.filters.parse_geometry = monkeypatch_parse_geometry
+
+
 @attr.s
 class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
     """Client for core endpoints defined by stac."""
@@ -85,10 +128,15 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
         default=serializers.CollectionSerializer
     )
     storage_srid: int = attr.ib(default=4326)
+    # Seconds collection responses are cached for, 0 disables the cache
+    cache_ttl: float = attr.ib(default=60)
+    _cache: TTLCache = attr.ib(
+        init=False,
+        default=attr.Factory(lambda self: TTLCache(ttl=self.cache_ttl), takes_self=True),
+        repr=False,
+    )
 
-    FIELD_MAPPING = {}
-    for q in Queryables.get_all_queryables():
-        FIELD_MAPPING[q] = item_table._default.get_field(q)
+    FIELD_MAPPING = _FIELD_MAPPING
 
     @staticmethod
     def _lookup_id(
@@ -129,25 +177,38 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
         else:
             geom = self.item_table.footprint
 
+        # Correlated subquery, so the (transformed) envelope is computed once per row
+        # and not once for each ordinate
+        envelope = (
+            sa.select([ga.func.Box2D(geom).label("envelope")])
+            .correlate(self.item_table)
+            .alias("envelope")
+        ).c.envelope
         return with_expression(
             self.item_table.bbox,
-            array(
+            sa.select(
                 [
-                    ga.func.ST_XMin(ga.func.ST_Envelope(geom)),
-                    ga.func.ST_YMin(ga.func.ST_Envelope(geom)),
-                    ga.func.ST_XMax(ga.func.ST_Envelope(geom)),
-                    ga.func.ST_YMax(ga.func.ST_Envelope(geom)),
+                    array(
+                        [
+                            ga.func.ST_XMin(envelope),
+                            ga.func.ST_YMin(envelope),
+                            ga.func.ST_XMax(envelope),
+                            ga.func.ST_YMax(envelope),
+                        ]
+                    )
                 ]
-            ),
+            ).as_scalar(),
         )
 
-    def create_crs_response(self, resp, crs, **kwargs) -> JSONResponse:
-        """Add Content-Crs header to JSONResponse to comply with OGC API Feat part 2"""
+    def create_crs_response(
+        self, resp, crs, response_class: Type[Response] = ORJSONResponse, **kwargs
+    ) -> Response:
+        """Add Content-Crs header to the response to comply with OGC API Feat part 2"""
         crs_ext = self.get_extension("CrsExtension")
         if crs is None:
             crs = crs_ext.storageCrs
         if crs in crs_ext.crs:  # If the CRS is valid
-            return JSONResponse(resp, headers={"Content-Crs": crs})
+            return response_class(resp, headers={"Content-Crs": crs})
         else:
             return resp
 
@@ -159,14 +220,20 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
         return ApiTokenHrefBuilder(base_url, token)
 
     def all_collections(self, **kwargs) -> Collections:
-        """Read all collections from the database."""
+        """Read all collections from the database, cached for `cache_ttl` seconds."""
         hrefbuilder = self.href_builder(**kwargs)
+        return self._cache.get_or_set(
+            ("collections", hrefbuilder.base_url, hrefbuilder.token),
+            lambda: self._all_collections(hrefbuilder),
+        )
+
+    def _all_collections(self, hrefbuilder: ApiTokenHrefBuilder) -> Collections:
+        """Read all collections from the database."""
         with self.session.session_maker.context_session() as session:
             collections = session.query(self.collection_table).all()
-            serialized_collections = [
-                self.collection_serializer.db_to_stac(collection, hrefbuilder)
-                for collection in collections
-            ]
+            serialized_collections = self.collection_serializer.db_to_stac_batch(
+                collections, hrefbuilder
+            )
             # TODO: incorporate this into the serializer perhaps
             if self.extension_is_enabled("CrsExtension"):
                 for c in serialized_collections:
@@ -195,8 +262,15 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
             return collection_list
 
     def get_collection(self, id: str, **kwargs) -> Collection:
-        """Get collection by id."""
+        """Get collection by id, cached for `cache_ttl` seconds."""
         hrefbuilder = self.href_builder(**kwargs)
+        return self._cache.get_or_set(
+            ("collection", id, hrefbuilder.base_url, hrefbuilder.token),
+            lambda: self._get_collection(id, hrefbuilder),
+        )
+
+    def _get_collection(self, id: str, hrefbuilder: ApiTokenHrefBuilder) -> Collection:
+        """Get collection by id."""
         with self.session.session_maker.context_session() as session:
             collection = self._lookup_id(id, self.collection_table, session)  #
 
@@ -214,7 +288,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
         self,
         id: str,
         ids: Optional[List[str]] = None,
-        bbox: str = None,
+        bbox: Optional[List[NumType]] = None,
         bbox_crs: str = None,
         datetime: Optional[Union[str, datetime]] = None,
         crs: Optional[str] = None,
@@ -252,7 +326,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                     + ",".join(self.get_extension("CrsExtension").crs),
                 )
         if bbox:
-            base_args["bbox"] = tuple(map(float, bbox.split(",")))
+            base_args["bbox"] = bbox
         if crs:
             if self.get_extension("CrsExtension").is_crs_supported(crs):
                 base_args["crs"] = crs
@@ -277,6 +351,10 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
 
         # Pagination
         hrefbuilder = self.href_builder(**kwargs)
+        base_params = dict(kwargs["request"].query_params)
+        if not "limit" in base_params:
+            base_params["limit"] = limit
+        items_path = f"collections/{id}/items"
         page_links = []
         for link in resp["links"]:
             if (
@@ -284,15 +362,9 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                 or link["rel"] == Relations.previous
                 or link["rel"] == Relations.self
             ):
-                query_params = dict(kwargs["request"].query_params)
-                if link["body"]:
-                    query_params.update(link["body"])
-                if not "limit" in query_params:
-                    query_params.update({"limit": limit})
+                query_params = {**base_params, **(link["body"] or {})}
                 link["method"] = "GET"
-                link["href"] = hrefbuilder.build(
-                    f"collections/{id}/items", query_params
-                )
+                link["href"] = hrefbuilder.build(items_path, query_params)
                 link.pop("body", None)  # body only relevant for POST
                 page_links.append(link)
             else:
@@ -301,7 +373,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
 
         # ItemCollection
         if self.extension_is_enabled("CrsExtension"):
-            return self.create_crs_response(resp, crs)
+            return self.create_crs_response(resp, crs, GeoJSONStreamingResponse)
 
         return resp
 
@@ -369,12 +441,15 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
         """GET search catalog."""
         # Parse request parameters
 
+        filter_json = orjson.loads(filter) if filter else filter
+        # Normalized filter for the links, dumped before validation adds filter-crs to the geometries
+        link_filter = orjson.dumps(filter_json).decode() if filter else None
         base_args = {
             "collections": collections,
             "ids": ids,
             "bbox": bbox,
             "limit": limit,
-            "filter": json.loads(filter) if filter else filter,
+            "filter": filter_json,
             "filter_lang": filter_lang or "cql-json",
             "filter_crs": filter_crs or "http://www.opengis.net/def/crs/OGC/1.3/CRS84",
             "pt": pt,
@@ -385,7 +460,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
         if bbox_crs:
             base_args["bbox_crs"] = bbox_crs
         if intersects:
-            base_args["intersects"] = json.loads(intersects)
+            base_args["intersects"] = orjson.loads(intersects)
         if datetime:
             base_args["datetime"] = datetime
         if sortby:
@@ -435,20 +510,21 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                 status_code=400,
                 detail=["Invalid parameters provided"] + str(e).split("\n"),
             )
-        resp = self.post_search(search_request, False, request=kwargs["request"])
+        resp = self.post_search(
+            search_request, False, request=kwargs["request"], link_filter=link_filter
+        )
 
         # Pagination
         page_links = []
         hrefbuilder = self.href_builder(**kwargs)
+        base_params = dict(kwargs["request"].query_params)
         for link in resp["links"]:
             if (
                 link["rel"] == Relations.next
                 or link["rel"] == Relations.previous
                 or link["rel"] == Relations.self
             ):
-                query_params = dict(kwargs["request"].query_params)
-                if link["body"]:
-                    query_params.update(link["body"])
+                query_params = {**base_params, **(link["body"] or {})}
                 link["href"] = hrefbuilder.build("search", query_params)
                 link["method"] = "GET"
                 link.pop("body", None) # Body only used for POST
@@ -470,7 +546,24 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                 self.from_token(search_request.pt) if search_request.pt else False
             )
 
-            query = session.query(self.item_table)
+            # Bound once, they are used throughout the query building
+            item_table = self.item_table
+            footprint_col = item_table.footprint
+            id_col = item_table.id
+            datetime_col = item_table.datetime
+            collection_col = item_table.collection_id
+
+            query = session.query(item_table)
+            # Don't fetch the columns the serializer doesn't use
+            # The serializer reads indexed fields by their name without extension prefix
+            indexed_columns = {field.split(":")[-1] for field in Settings.get().indexed_fields}
+            query = query.options(
+                *(
+                    defer(getattr(item_table, column))
+                    for column in getattr(self.item_serializer, "unused_columns", ())
+                    if column not in indexed_columns
+                )
+            )
             # Make sure output is in correct srids
             if (
                 hasattr(search_request, "crs")
@@ -500,20 +593,24 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
             # Filter by collection
             count = None
             if search_request.collections:
-                collection_id_filter = sa.or_(
-                    *[
-                        self.item_table.collection_id == col_id
-                        for col_id in search_request.collections
-                    ]
+                # Expanding IN parameter: the same SQL whatever the number of collections
+                collection_id_filter = collection_col.in_(
+                    sa.bindparam(
+                        "collection_ids",
+                        value=list(search_request.collections),
+                        expanding=True,
+                    )
                 )
                 query = query.filter(collection_id_filter)
 
             # Ignore other parameters if ID is present
             if search_request.ids:
-                id_filter = sa.or_(
-                    *[self.item_table.id == i for i in search_request.ids]
+                id_filter = id_col.in_(
+                    sa.bindparam("ids", value=list(search_request.ids), expanding=True)
                 )
-                items = query.filter(id_filter).order_by(self.item_table.id)
+                # The only ordering in this branch, and the keyset get_page pages by. The count
+                # is the number of requested ids, so a single statement is issued
+                items = query.filter(id_filter).order_by(id_col)
                 page = get_page(
                     items, per_page=search_request.limit, page=pagination_token
                 )
@@ -533,21 +630,19 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
             else:
                 # Spatial query
                 geom = None
+                bbox_2d = None
                 if search_request.intersects is not None:
                     geom = shape(search_request.intersects)
                 elif search_request.bbox:
-                    if len(search_request.bbox) == 4:
-                        geom = ShapelyPolygon.from_bounds(*search_request.bbox)
-                    elif len(search_request.bbox) == 6:
-                        """Shapely doesn't support 3d bounding boxes we'll just use the 2d portion"""
-                        bbox_2d = [
-                            search_request.bbox[0],
-                            search_request.bbox[1],
-                            search_request.bbox[3],
-                            search_request.bbox[4],
-                        ]
-                        geom = ShapelyPolygon.from_bounds(*bbox_2d)
-                if geom:
+                    bbox = search_request.bbox
+                    if len(bbox) == 4:
+                        bbox_2d = tuple(bbox)
+                    elif len(bbox) == 6:
+                        # Only the 2d portion of 3d bounding boxes is used
+                        bbox_2d = (bbox[0], bbox[1], bbox[3], bbox[4])
+                # Centroid of the search geometry, the results are sorted by the distance to it
+                centroid = None
+                if geom is not None or bbox_2d:
                     bbox_srid = 4326
                     if search_request.bbox_crs and self.extension_is_enabled(
                         "CrsExtension"
@@ -555,67 +650,69 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                         bbox_srid = self.get_extension("CrsExtension").epsg_from_crs(
                             search_request.bbox_crs
                         )
-                    filter_geom = ga.shape.from_shape(geom, srid=bbox_srid)
-
-                    if bbox_srid == self.storage_srid:
-                        query = query.filter(
-                            ga.func.ST_Intersects(
-                                self.item_table.footprint, filter_geom
-                            )
+                    if bbox_2d:
+                        # The bounds are sent as plain parameters, no geometry is built and encoded here
+                        filter_geom = ga.func.ST_MakeEnvelope(*bbox_2d, bbox_srid)
+                        centroid = (
+                            (bbox_2d[0] + bbox_2d[2]) / 2,
+                            (bbox_2d[1] + bbox_2d[3]) / 2,
                         )
                     else:
-                        query = query.filter(
-                            ga.func.ST_Intersects(
-                                ga.func.ST_Transform(filter_geom, self.storage_srid),
-                                self.item_table.footprint,
-                            ),
-                        )
+                        filter_geom = ga.shape.from_shape(geom, srid=bbox_srid)
+                        centroid = (geom.centroid.x, geom.centroid.y)
+                    if bbox_srid != self.storage_srid:
+                        # Transform the constant search geometry, never the footprint column
+                        filter_geom = ga.func.ST_Transform(filter_geom, self.storage_srid)
+
+                    # Index-only bounding box test first, ST_Intersects rechecks the candidates
+                    query = query.filter(
+                        footprint_col.op("&&")(filter_geom),
+                        ga.func.ST_Intersects(footprint_col, filter_geom),
+                    )
                     # Finds and sorts by the input geometry centroid and calculates the distance to the footprint centroid.
                     distance = ga.func.ST_Distance(
                         ga.func.ST_Centroid(
-                                ga.func.ST_Envelope(self.item_table.footprint)
+                                ga.func.ST_Envelope(footprint_col)
                             ),
                         # Footprint in the database are in srid 4326
-                        ga.func.ST_Transform(ga.func.ST_GeomFromText(str(geom.centroid),self.storage_srid),self.storage_srid)
+                        ga.func.ST_Transform(ga.func.ST_SetSRID(ga.func.ST_MakePoint(*centroid), self.storage_srid), self.storage_srid)
                         )
                     query = query.order_by(distance)
 
                 # Temporal query
                 if search_request.datetime:
-                    # Two tailed query (between)
-                    dts = search_request.datetime.split("/")
-                    # Non-interval date ex. "2000-02-02T00:00:00.00Z"
-                    if len(dts) == 1:
-                        query = query.filter(self.item_table.datetime == dts[0])
-                    # If both dates are valid strings, it's a between comparison
+                    start, end = search_request.datetime_interval
+                    # Single datetime ex. "2000-02-02T00:00:00.00Z"
+                    if start is not None and start == end:
+                        query = query.filter(datetime_col == start)
+                    # Closed interval (between)
                     # 2000-02-02T00:00:00.00Z/2000-02-02T00:00:00.00Z
-                    elif not any(x in dts for x in ["..", ""]):
-                        query = query.filter(self.item_table.datetime.between(*dts))
+                    elif start is not None and end is not None:
+                        query = query.filter(datetime_col.between(start, end))
                     # All items after the start date
                     # 2000-02-02T00:00:00.00Z/.. or 2000-02-02T00:00:00.00Z/
-                    elif dts[0] not in ["..", ""]:
-                        query = query.filter(self.item_table.datetime >= dts[0])
+                    elif start is not None:
+                        query = query.filter(datetime_col >= start)
                     # All items before the end date
                     # ../2000-02-02T00:00:00.00Z or /2000-02-02T00:00:00.00Z
-                    elif dts[1] not in ["..", ""]:
-                        query = query.filter(self.item_table.datetime <= dts[1])
+                    elif end is not None:
+                        query = query.filter(datetime_col <= end)
 
                 if search_request.filter:
-                    # monkey patch parse_geometry from pygeofilter
-                    pygeofilter.backends.sqlalchemy.filters.parse_geometry = monkeypatch_parse_geometry
                     sa_expr = to_filter(search_request.filter, self.FIELD_MAPPING)
                     
                     geometry = get_geometry_filter(search_request.filter)
                     if geometry is not None:
                         geom = shape(geometry)
-                    if geom:
+                        centroid = (geom.centroid.x, geom.centroid.y)
+                    if centroid:
                         # Finds and sorts by the input geometry centroid and calculates the distance to the footprint centroid.
                         distance = ga.func.ST_Distance(
                             ga.func.ST_Centroid(
-                                    ga.func.ST_Envelope(self.item_table.footprint)
+                                    ga.func.ST_Envelope(footprint_col)
                                 ),
                             # Footprint in the database are in srid 4326
-                            ga.func.ST_Transform(ga.func.ST_GeomFromText(str(geom.centroid), search_request.filter_crs),self.storage_srid)
+                            ga.func.ST_Transform(ga.func.ST_SetSRID(ga.func.ST_MakePoint(*centroid), search_request.filter_crs), self.storage_srid)
                             )
 
                         query = query.filter(sa_expr).order_by(distance)
@@ -624,30 +721,45 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                     
                 # Sort
                 if search_request.sortby:
-                    sort_fields = [
-                        getattr(
-                            self.item_table.get_field(sort.field),
-                            sort.direction.value,
-                        )()
-                        for sort in search_request.sortby
-                    ]
-                    sort_fields.append(self.item_table.id)
+                    # Queryable columns are resolved once, in FIELD_MAPPING
+                    field_mapping = self.FIELD_MAPPING
+                    sort_fields = []
+                    for sort in search_request.sortby:
+                        column = field_mapping.get(sort.field)
+                        if column is None:
+                            column = item_table.get_field(sort.field)
+                        sort_fields.append(
+                            column.desc() if sort.direction.value == "desc" else column.asc()
+                        )
+                    sort_fields.append(id_col)
                     query = query.order_by(*sort_fields)
                 else:
                     # Default sort is date
                     query = query.order_by(
-                        self.item_table.datetime.desc(), self.item_table.id
+                        datetime_col.desc(), id_col
                     )
 
+                window_count = False
                 if self.extension_is_enabled("ContextExtension"):
-                    count_query = query.statement.with_only_columns(
-                        [func.count()]
-                    ).order_by(None)
-                    count = query.session.execute(count_query).scalar()
+                    if pagination_token:
+                        # The keyset condition of later pages would also limit a window count
+                        count_query = query.statement.with_only_columns(
+                            [func.count()]
+                        ).order_by(None)
+                        count = query.session.execute(count_query).scalar()
+                    else:
+                        # Count with the page query itself, saving a round trip
+                        query = query.add_columns(
+                            func.count().over().label("total_count")
+                        )
+                        window_count = True
 
                 page = get_page(
                     query, per_page=search_request.limit, page=pagination_token
                 )
+                if window_count:
+                    count = page[0].total_count if page else 0
+                    page[:] = [row[0] for row in page]
                 # Create dynamic attributes for each page
                 page.next = (
                     self.to_token(keyset=page.paging.bookmark_next)
@@ -662,6 +774,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
 
             links = []
             hrefbuilder = self.href_builder(**kwargs)
+            search_href = hrefbuilder.build("./search")
             if is_direct_post:
                 query_params = dict(
                     kwargs["request"]._json
@@ -669,9 +782,10 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
             else:
                 query_params = dict(kwargs["request"].query_params)
                 if "filter" in query_params:
-                    query_params["filter"] = json.dumps(
-                        json.loads(query_params["filter"])
-                    )  # parse and dump json to prettify link in case of "ugly" but valid input formatting
+                    # parse and dump json to prettify link in case of "ugly" but valid input formatting
+                    query_params["filter"] = kwargs.get("link_filter") or orjson.dumps(
+                        orjson.loads(query_params["filter"])
+                    ).decode()
 
             if not "limit" in query_params:
                 query_params.update(
@@ -682,7 +796,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                 {
                     "rel": Relations.self.value,
                     "type": "application/geo+json",
-                    "href": hrefbuilder.build("./search"),
+                    "href": search_href,
                     "method": "POST",
                     "body": {
                         **query_params,
@@ -697,7 +811,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                     {
                         "rel": Relations.next.value,
                         "type": "application/geo+json",
-                        "href": hrefbuilder.build("./search"),
+                        "href": search_href,
                         "method": "POST",
                         "body": {
                             **query_params,
@@ -711,7 +825,7 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                     {
                         "rel": Relations.previous.value,
                         "type": "application/geo+json",
-                        "href": hrefbuilder.build("./search"),
+                        "href": search_href,
                         "method": "POST",
                         "body": {
                             **query_params,
@@ -722,15 +836,13 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
             response_features = []
             filter_kwargs = {}
 
-            # rewritten as a list-comprehension to speedup creation of the list
-            # Enumerations should be faster than looping and appending
             crs_obj = {
                 "type": "name",
                 "properties": {"name": f"{output_crs}"},
             }
-            response_features = [self.item_serializer.db_to_stac(item,hrefbuilder) for i,item in enumerate(page)]
+            response_features = self.item_serializer.db_to_stac_batch(page, hrefbuilder)
 
-            # Use pydantic includes/excludes syntax to implement fields extension
+            # Use pydantic includes/excludes syntax to implement fields extension, applied to the item dicts
             if (
                 self.extension_is_enabled("FieldsExtension")
                 and search_request.field is not None
@@ -750,11 +862,9 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
                         search_request.field.include.union(query_include)
 
                 filter_kwargs = search_request.field.filter_fields
-                # Need to pass through `.json()` for proper serialization
-                # of datetime
                 response_features = [
-                    json.loads(stac_pydantic.Item(**feat).json(**filter_kwargs))
-                    for feat, in enumerate(response_features)
+                    _apply_fields(feat, filter_kwargs["include"], filter_kwargs["exclude"])
+                    for feat in response_features
                 ]
 
         for _,feat in enumerate(response_features):
@@ -779,6 +889,13 @@ class CoreCrudClient(PaginationTokenClient, BaseCoreClient):
 @attr.s
 class CoreFiltersClient(BaseFiltersClient):
     session: Session = attr.ib(default=attr.Factory(Session.create_from_env))
+    # Seconds queryables responses are cached for, 0 disables the cache
+    cache_ttl: float = attr.ib(default=60)
+    _cache: TTLCache = attr.ib(
+        init=False,
+        default=attr.Factory(lambda self: TTLCache(ttl=self.cache_ttl), takes_self=True),
+        repr=False,
+    )
 
     def validate_collection(self, value):
         # client = CoreCrudClient(session=self.session, collection_table=database.Collection)
@@ -790,6 +907,16 @@ class CoreFiltersClient(BaseFiltersClient):
 
     def get_queryables(
         self, collection_id: Optional[str] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """Get the queryables available for the given collection_id, cached for `cache_ttl` seconds."""
+        base_url = str(kwargs["request"].base_url)
+        return self._cache.get_or_set(
+            ("queryables", kwargs.get("id", collection_id), base_url),
+            lambda: self._get_queryables(collection_id, **kwargs),
+        )
+
+    def _get_queryables(
+        self, collection_id: Optional[str] = None, **kwargs
     ) -> Dict[str, Any]:
         """Get the queryables available for the given collection_id.
 
@@ -822,9 +949,8 @@ class CoreFiltersClient(BaseFiltersClient):
         )
 
         res = {}
-        queryables.sort()
-        for q in base_queryables + queryables:
-            q_type = getattr(QueryableInfo, Queryables.get_queryable(q).name)
+        for q in (*base_queryables, *queryables):
+            q_type = _QUERYABLE_INFO[q]
             res[q] = {
                 "description": q_type[2],
                 "$ref" if q_type[3] else "type": q_type[3] if q_type[3] else q_type[1],
@@ -2,7 +2,7 @@
 import abc
 import json
 from datetime import datetime, timedelta, timezone
-from typing import Dict, TypedDict, Any
+from typing import Dict, Iterable, List, TypedDict, Any
 import urllib.parse
 
 import attr
@@ -64,6 +64,13 @@ class Serializer(abc.ABC):
         """Transform database model to stac."""
         ...
 
+    @classmethod
+    def db_to_stac_batch(
+        cls, db_models: Iterable[database.BaseModel], hrefbuilder: ApiTokenHrefBuilder
+    ) -> List[TypedDict]:
+        """Transform several database models to stac."""
+        return [cls.db_to_stac(db_model, hrefbuilder) for db_model in db_models]
+
     @classmethod
     @abc.abstractmethod
     def stac_to_db(
@@ -86,19 +93,58 @@ class Serializer(abc.ABC):
 class ItemSerializer(Serializer):
     """Serialization methods for STAC items."""
 
+    # Columns of the item view which `db_to_stac` never reads, unless configured as indexed fields
+    unused_columns = (
+        "instrument_id",
+        "end_datetime",
+        "compound_crs",
+        "sensor_physical_width",
+        "sensor_physical_height",
+        "owner",
+    )
+
     @classmethod
     def _add_if_not_none(cls, dict: Dict, key: str, val: Any):
         """Adds value to dictionary with specified key if value is not None"""
         if val is not None:
             dict[key] = val
 
+    @classmethod
+    def _request_context(cls, hrefbuilder: ApiTokenHrefBuilder) -> Dict[str, Any]:
+        """Values which are the same for all items serialized with `hrefbuilder`."""
+        return {
+            "token_param": {"token": hrefbuilder.token} if hrefbuilder.token else {},
+            "indexed_fields": settings.indexed_fields,
+            "viewer_url": f"{settings.cogtiler_basepath}/viewer.html",
+            "thumbnail_url": f"{settings.cogtiler_basepath}/thumbnail.jpg",
+        }
+
     @classmethod
     def db_to_stac(
         cls, db_model: database.ImageView, hrefbuilder: ApiTokenHrefBuilder
+    ) -> stac_types.Item:
+        """Transform database model to stac item."""
+        return cls._db_to_stac(db_model, hrefbuilder, cls._request_context(hrefbuilder))
+
+    @classmethod
+    def db_to_stac_batch(
+        cls, db_models: Iterable[database.ImageView], hrefbuilder: ApiTokenHrefBuilder
+    ) -> List[stac_types.Item]:
+        """Transform database models to stac items, sharing the per-request work."""
+        context = cls._request_context(hrefbuilder)
+        _db_to_stac = cls._db_to_stac
+        return [_db_to_stac(db_model, hrefbuilder, context) for db_model in db_models]
+
+    @classmethod
+    def _db_to_stac(
+        cls,
+        db_model: database.ImageView,
+        hrefbuilder: ApiTokenHrefBuilder,
+        context: Dict[str, Any],
     ) -> stac_types.Item:
         """Transform database model to stac item."""
         properties = db_model.properties.copy()
-        indexed_fields = settings.indexed_fields
+        indexed_fields = context["indexed_fields"]
         for field in indexed_fields:
             # Use getattr to accommodate extension namespaces
             field_value = getattr(db_model, field.split(":")[-1])
@@ -114,7 +160,7 @@ class ItemSerializer(Serializer):
             collection_id=collection_id, item_id=item_id, href_builder=hrefbuilder
         ).create_links()
 
-        token_param = {"token": hrefbuilder.token} if hrefbuilder.token else {}
+        token_param = context["token_param"]
         cog_url = _add_query_params(db_model.data_path, token_param)
         tiler_params = {"url": db_model.data_path, **token_param}
 
@@ -127,9 +173,7 @@ class ItemSerializer(Serializer):
             },
             {
                 "rel": "alternate",
-                "href": _add_query_params(
-                    f"{settings.cogtiler_basepath}/viewer.html", tiler_params
-                ),
+                "href": _add_query_params(context["viewer_url"], tiler_params),
                 "type": "text/html; charset=UTF-8",
                 "title": "Interactive image viewer",
             },
@@ -150,9 +194,7 @@ class ItemSerializer(Serializer):
                 "title": "Raw tiff file",
             },
             "thumbnail": {
-                "href": _add_query_params(
-                    f"{settings.cogtiler_basepath}/thumbnail.jpg", tiler_params
-                ),
+                "href": _add_query_params(context["thumbnail_url"], tiler_params),
                 "type": "image/jpeg",
                 "roles": ["thumbnail"],
                 "title": "Thumbnail",
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 class FastAPISessionMaker(_FastAPISessionMaker):
     """FastAPISessionMaker."""
-    def __init__(self, database_uri: str, connect_args: dict):
+    def __init__(self, database_uri: str, connect_args: dict, pool_options: Optional[dict] = None):
         """
         `database_uri` should be any sqlalchemy-compatible database URI.
 
@@ -32,6 +32,7 @@ class FastAPISessionMaker(_FastAPISessionMaker):
         """
         self.database_uri = database_uri
         self.connect_args = connect_args
+        self.pool_options = pool_options or {}
 
         self._cached_engine: Optional[sa.engine.Engine] = None
         self._cached_sessionmaker: Optional[sa.orm.sessionmaker] = None
@@ -55,16 +56,17 @@ class FastAPISessionMaker(_FastAPISessionMaker):
         """
         Returns a new sqlalchemy engine using the instance's database_uri.
         """
-        return get_engine(self.database_uri,self.connect_args)
+        return get_engine(self.database_uri, self.connect_args, **self.pool_options)
 
 # Overridge get_engine, so we can send connection_args
-def get_engine(uri: str, connect_args: dict) -> sa.engine.Engine:
+def get_engine(uri: str, connect_args: dict, **pool_options) -> sa.engine.Engine:
     """
     Returns a sqlalchemy engine with pool_pre_ping enabled.
 
+    `pool_options` (eg. pool_size, max_overflow, pool_recycle) are passed on to the connection pool.
     This function may be updated over time to reflect recommended engine configuration for use with FastAPI.
     """
-    return sa.create_engine(uri, pool_pre_ping=True, connect_args=connect_args)
+    return sa.create_engine(uri, pool_pre_ping=True, connect_args=connect_args, **pool_options)
 
 @attr.s
 class Session:
@@ -72,7 +74,8 @@ class Session:
 
     conn_string: str = attr.ib()
     connect_args: dict = attr.ib()
-    
+    pool_options: dict = attr.ib(factory=dict)
+
     @classmethod
     def create_from_env(cls):
         """Create from environment."""
@@ -86,9 +89,16 @@ class Session:
         """Create a Session object from settings."""
         return cls(
             conn_string=settings.connection_string,
-            connect_args=settings.connect_args
+            connect_args=settings.connect_args,
+            pool_options={
+                "pool_size": settings.db_pool_size,
+                "max_overflow": settings.db_max_overflow,
+                "pool_recycle": settings.db_pool_recycle,
+            },
         )
 
     def __attrs_post_init__(self):
         """Post init handler."""
-        self.session_maker: FastAPISessionMaker = FastAPISessionMaker(self.conn_string,self.connect_args)
+        self.session_maker: FastAPISessionMaker = FastAPISessionMaker(
+            self.conn_string, self.connect_args, self.pool_options
+        )
@@ -2,6 +2,8 @@
 
 # TODO: replace with stac-pydantic
 """
+import functools
+from collections import defaultdict, deque
 from datetime import datetime
 from geojson_pydantic.geometries import (
     GeometryCollection,
@@ -13,20 +15,20 @@ from geojson_pydantic.geometries import (
     Polygon,
     _GeometryBase,
 )
+import orjson
 from pydantic.datetime_parse import parse_datetime
 from stac_pydantic.api.extensions.sort import SortExtension
 
 import logging
-from typing import Any, Dict, List, Optional, Set, Union, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Union, Tuple
 from pydantic import (
     BaseModel,
     Field,
-    ValidationError,
+    PrivateAttr,
     conint,
     root_validator,
     validator,
 )
-from pydantic.error_wrappers import ErrorWrapper
 
 # from stac_pydantic.api.extensions.fields import FieldsExtension as FieldsBase
 from stac_pydantic.shared import BBox
@@ -42,12 +44,71 @@ from pygeofilter import ast
 
 from stac_fastapi.extensions.core.crs import CrsExtension
 
+# The datetimes of a search are parsed when validating and again when building the query.
+# Parsed datetimes are immutable, so the parses are shared
+_parse_datetime = functools.lru_cache(maxsize=256)(parse_datetime)
+
 # Be careful: https://github.com/samuelcolvin/pydantic/issues/1423#issuecomment-642797287
 NumType = Union[float, int]
 
 
+# Operations of the pygeofilter cql-json parser, used to find the operation nodes of a filter
+_PGF_OPS = {
+    **pgf_cql_json.parser.COMPARISON_MAP,
+    **pgf_cql_json.parser.SPATIAL_PREDICATES_MAP,
+    **pgf_cql_json.parser.TEMPORAL_PREDICATES_MAP,
+    **pgf_cql_json.parser.ARRAY_PREDICATES_MAP,
+    **pgf_cql_json.parser.ARITHMETIC_MAP,
+}
+# A tuple, so nodes are matched with a single isinstance() call
+_PGF_OP_TYPES = tuple(set(_PGF_OPS.values()))
+_REMOVED_OPS = ()  # operations we don't want to expose eg. ("meets", "metby")
+# full list of operations supported in pygeofiler, except the array predicates and _REMOVED_OPS
+_DEFAULT_VALID_OPS = frozenset(
+    {
+        **pgf_cql_json.parser.COMPARISON_MAP,
+        **pgf_cql_json.parser.SPATIAL_PREDICATES_MAP,
+        **pgf_cql_json.parser.TEMPORAL_PREDICATES_MAP,
+        # **pgf_cql_json.parser.ARRAY_PREDICATES_MAP,
+        **pgf_cql_json.parser.ARITHMETIC_MAP,
+    }
+).difference(_REMOVED_OPS)
+# Bound once. The settings themselves are only set when the API is created, so they are read on each call
+_get_settings = Settings.get
+# Only read by the validators
+_CRS_EXTENSION = CrsExtension()
+_SUPPORTED_CRS = frozenset(_CRS_EXTENSION.crs)
+# Supported crs URI -> SRID, and the SRIDs as strings as they may be given for filter-crs
+_CRS_TO_SRID = {crs: _CRS_EXTENSION.epsg_from_crs(crs) for crs in _CRS_EXTENSION.crs}
+_SRID_SET = frozenset(str(srid) for srid in _CRS_TO_SRID.values())
+
+
+def _validate_one_crs(crs: Optional[str], label: str) -> Optional[str]:
+    """Check that a crs parameter, eg. `bbox-crs`, is empty or one of the supported crs."""
+    if crs:
+        if crs not in _SUPPORTED_CRS:
+            raise ValueError(
+                f"'{crs}' is not a supported {label}. Currently supported crs are: {_CRS_EXTENSION.crs}"
+            )
+        return crs
+
+
+# GeoJSON geometry types which get the filter-crs added
+_GEOM_TYPES = frozenset(
+    (
+        "Polygon",
+        "LineString",
+        "Point",
+        "MultiPolygon",
+        "MultiLineString",
+        "MultiPoint",
+    )
+)
+
+
 class Queryables:
-    base_queryables = [q.value for q in BaseQueryables]
+    # A tuple rather than a set, the queryables schema lists them in this order
+    base_queryables = tuple(q.value for q in BaseQueryables)
     collections = {
         "skraafotos2017": SkraafotosProperties,
         "skraafotos2019": SkraafotosProperties,
@@ -55,6 +116,18 @@ class Queryables:
         # "test-collection": SkraafotosProperties,
     }
 
+    _base_queryable_set: FrozenSet[str] = frozenset(base_queryables)
+    # Queryable properties of each collection apart from the base queryables, computed once
+    _collection_queryables: Dict[str, FrozenSet[str]] = {}
+    for _collection_id, _properties in collections.items():
+        _collection_queryables[_collection_id] = frozenset(
+            q.value for q in _properties
+        ) - _base_queryable_set
+    del _collection_id, _properties
+    _all_queryables: Tuple[str, ...] = tuple(
+        sorted(_base_queryable_set.union(*_collection_queryables.values()))
+    )
+
     @classmethod
     def get_queryable(cls, name):
         if name in BaseQueryables._value2member_map_:
@@ -66,35 +139,35 @@ class Queryables:
     @classmethod
     def get_queryable_properties_intersection(
         cls, collection_ids: List = []
-    ) -> Tuple[List, List]:
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Base queryables, and the sorted collection queryables shared by the collections."""
         if len(collection_ids) == 0:
             collection_ids = (
                 cls.collections.keys()
             )  # empty defaults to intersection across all collections
-        all_queryables = []
-        for collection in collection_ids:
-            if collection in cls.collections:
-                all_queryables.append(
-                    [
-                        q.value
-                        for q in cls.collections[collection]
-                        if q not in cls.base_queryables
-                    ]
-                )
+        # Searches only ever use a handful of collection combinations
+        return cls._queryables_intersection(tuple(sorted(set(collection_ids))))
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _queryables_intersection(
+        cls, collection_ids: Tuple[str, ...]
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        all_queryables = [
+            cls._collection_queryables[collection]
+            for collection in collection_ids
+            if collection in cls._collection_queryables
+        ]
 
         shared_queryables = (
-            set.intersection(*[set(x) for x in all_queryables])
-            if len(all_queryables) > 0
-            else set()
+            frozenset.intersection(*all_queryables) if all_queryables else frozenset()
         )
-        return cls.base_queryables, list(shared_queryables)
+        return cls.base_queryables, tuple(sorted(shared_queryables))
 
     @classmethod
-    def get_all_queryables(cls) -> List[str]:
-        all_queryables = cls.base_queryables
-        for collection in cls.collections.values():
-            all_queryables = all_queryables + [q.value for q in collection]
-        return list(set(all_queryables))
+    def get_all_queryables(cls) -> Tuple[str, ...]:
+        """All queryables, sorted. The tuple is shared, callers only iterate it."""
+        return cls._all_queryables
 
 
 class FieldsExtension(BaseModel):
@@ -115,17 +188,16 @@ class FieldsExtension(BaseModel):
         Internal method to create a dictionary for advanced include or exclude of pydantic fields on model export
         Ref: https://pydantic-docs.helpmanual.io/usage/exporting_models/#advanced-include-and-exclude
         """
-        field_dict = {}
-        for field in fields or []:
-            if "." in field:
-                parent, key = field.split(".")
-                if parent not in field_dict:
-                    field_dict[parent] = {key}
-                else:
-                    field_dict[parent].add(key)
+        nested = defaultdict(set)
+        flat = {}
+        for field in fields or ():
+            parent, sep, key = field.partition(".")
+            if sep:
+                nested[parent].add(key)
             else:
-                field_dict[field] = ...  # type:ignore
-        return field_dict
+                flat[field] = ...  # type:ignore
+        # A whole field overrides selected keys of the same field
+        return {**nested, **flat}
 
     @property
     def filter_fields(self) -> Dict:
@@ -135,10 +207,15 @@ class FieldsExtension(BaseModel):
         to the API
         Ref: https://pydantic-docs.helpmanual.io/usage/exporting_models/#advanced-include-and-exclude
         """
+        default_includes = _get_settings().default_includes
+        if not self.include and not self.exclude:
+            # No fields requested, only the default includes apply
+            return {"include": self._get_field_dict(default_includes), "exclude": {}}
+
         # Always include default_includes, even if they
         # exist in the exclude list.
         include = (self.include or set()) - (self.exclude or set())
-        include |= Settings.get().default_includes or set()
+        include |= default_includes or set()
 
         return {
             "include": self._get_field_dict(include),
@@ -185,6 +262,9 @@ class STACSearch(BaseModel):
     filter: Optional[Any]
     filter_fields: Optional[List[str]] = None
 
+    _datetime_interval: Optional[Tuple[Optional[datetime], Optional[datetime]]] = PrivateAttr(None)
+    _bbox_polygon: Optional[Polygon] = PrivateAttr(None)
+
     class Config:
         """Configures the pydantic model to allow populating it by field names (in addition to aliases)
 
@@ -192,58 +272,56 @@ class STACSearch(BaseModel):
         are NOT VALID python names so we cannot use them for populating the instance"""
 
         allow_population_by_field_name = True
+        # A validated search passed on to another model is used as is, never copied
+        copy_on_model_validation = "none"
 
     @classmethod
     def add_filter_crs(cls, data, crs):
         """Add filter-crs to geometry objects in filter
 
         Args:
-            data: The data to recursively traverse.
+            data: The data to traverse.
 
         Returns:
             None.
         """
 
-        if isinstance(data, list):
-            for val in data:
-                cls.add_filter_crs(val, crs)
-        elif isinstance(data, dict):
-            if data.get("type") in (
-                "Polygon",
-                "LineString",
-                "Point",
-                "MultiPolygon",
-                "MultiLineString",
-                "MultiPoint",
-            ):
-                data["crs"] = crs
-            else:
-                for key, value in data.items():
-                    cls.add_filter_crs(value, crs)
+        stack = deque([data])
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                if node.get("type") in _GEOM_TYPES:
+                    node["crs"] = crs
+                else:
+                    stack.extend(node.values())
 
-    @classmethod
-    def inOrderFieldCollect_rec(cls, expr) -> list:
-        """Collect all properties from the given expression
+    @staticmethod
+    def _walk_ast(expr) -> Iterator:
+        """Iterate over the nodes of the given expression
+
+        Negations are followed through `sub_node`, all other nodes through `lhs` and `rhs`.
 
         Args:
             expr: The abstract syntax tree to traverse.
 
         Returns:
-            A list of properties.
+            An iterator over the nodes, in no particular order.
         """
 
-        res = []
-        if expr:
-            if type(expr) == ast.Attribute:
-                res.append(expr.name)
-                return res
-            if type(expr) == ast.Not:
-                res = cls.inOrderFieldCollect_rec(expr.sub_node)
-            if hasattr(expr, "lhs"):
-                res = cls.inOrderFieldCollect_rec(expr.lhs)
-            if hasattr(expr, "rhs"):
-                res = res + cls.inOrderFieldCollect_rec(expr.rhs)
-        return res
+        stack = deque([expr])
+        while stack:
+            node = stack.pop()
+            if not node:
+                continue
+            yield node
+            if isinstance(node, ast.Not):
+                stack.append(node.sub_node)
+            if hasattr(node, "lhs"):
+                stack.append(node.lhs)
+            if hasattr(node, "rhs"):
+                stack.append(node.rhs)
 
     @classmethod
     def validate_filter_fields(cls, expr, valid_fields):
@@ -251,48 +329,20 @@ class STACSearch(BaseModel):
 
         Args:
             expr: The abstract syntax tree to traverse.
-            valid_fields: A list of valid fields to check against
-
-        Returns:
-            None.
-        """
-
-        res = list(set(cls.inOrderFieldCollect_rec(expr)))
-        for field_name in res:
-            if field_name not in valid_fields:
-                raise ValidationError(
-                    [
-                        ErrorWrapper(
-                            ValueError(f"Cannot search on field: {field_name}"),
-                            "STACSearch",
-                        )
-                    ],
-                    STACSearch,
-                )
-        return res
-
-    @classmethod
-    def inOrderOpsCollect_rec(cls, expr, pgf_ops) -> list:
-        """Collect all operations from the given expression
-
-        Args:
-            expr: The abstract syntax tree to traverse.
+            valid_fields: A set of valid fields to check against
 
         Returns:
-            A list of operations.
+            The sorted list of fields used in the expression.
         """
 
-        res = []
-        if expr:
-            if type(expr) in pgf_ops.values():
-                res.append(expr.op.name.lower())
-            if type(expr) == ast.Not:
-                res = res + cls.inOrderOpsCollect_rec(expr.sub_node, pgf_ops)
-            if hasattr(expr, "lhs"):
-                res = res + cls.inOrderOpsCollect_rec(expr.lhs, pgf_ops)
-            if hasattr(expr, "rhs"):
-                res = res + cls.inOrderOpsCollect_rec(expr.rhs, pgf_ops)
-        return res
+        fields = {
+            node.name for node in cls._walk_ast(expr) if isinstance(node, ast.Attribute)
+        }
+        invalid = fields.difference(valid_fields)
+        if invalid:
+            raise ValueError(f"Cannot search on field: {next(iter(invalid))}")
+        # `filter_fields` is declared as a list
+        return sorted(fields)
 
     @classmethod
     def validate_filter_ops(cls, expr, valid_ops):
@@ -300,92 +350,36 @@ class STACSearch(BaseModel):
 
         Args:
             expr: The abstract syntax tree to traverse.
-            valid_ops: A list of valid ops to check against
+            valid_ops: A set of valid ops to check against
 
         Returns:
             None.
         """
 
-        pgf_ops = {
-            **pgf_cql_json.parser.COMPARISON_MAP,
-            **pgf_cql_json.parser.SPATIAL_PREDICATES_MAP,
-            **pgf_cql_json.parser.TEMPORAL_PREDICATES_MAP,
-            **pgf_cql_json.parser.ARRAY_PREDICATES_MAP,
-            **pgf_cql_json.parser.ARITHMETIC_MAP,
+        res = {
+            node.op.name.lower()
+            for node in cls._walk_ast(expr)
+            if isinstance(node, _PGF_OP_TYPES)
         }
-        res = list(set(cls.inOrderOpsCollect_rec(expr, pgf_ops)))
         for op in res:
             if op == "ge":
                 op = "gte"  # because of inconsistent namings in pygeofilter - uses op names 'ge', 'le' in ast but 'gte', 'lte' in their cql-json parser
             if op == "le":
                 op = "lte"
             if op not in valid_ops:
-                raise ValidationError(
-                    [
-                        ErrorWrapper(
-                            ValueError(f"Unsupported operation: {expr}"),
-                            "STACSearch",
-                        )
-                    ],
-                    STACSearch,
-                )
+                raise ValueError(f"Unsupported operation: {expr}")
 
     @validator("bbox_crs")
     def validate_bbox_crs(cls, bbox_crs):
-        if bbox_crs:
-            crs_extension = CrsExtension()
-            if bbox_crs in crs_extension.crs:
-                return bbox_crs
-            else:
-                raise ValidationError(
-                    [
-                        ErrorWrapper(
-                            ValueError(
-                                f"'{bbox_crs}' is not a supported bbox-crs. Currently supported crs are: {crs_extension.crs}"
-                            ),
-                            "STACSearch",
-                        )
-                    ],
-                    STACSearch,
-                )
+        return _validate_one_crs(bbox_crs, "bbox-crs")
 
     @validator("crs")
     def validate_crs(cls, crs):
-        if crs:
-            crs_extension = CrsExtension()
-            if crs in crs_extension.crs:
-                return crs
-            else:
-                raise ValidationError(
-                    [
-                        ErrorWrapper(
-                            ValueError(
-                                f"'{crs}' is not a supported crs. Currently supported crs are: {crs_extension.crs}"
-                            ),
-                            "STACSearch",
-                        )
-                    ],
-                    STACSearch,
-                )
+        return _validate_one_crs(crs, "crs")
 
     @validator("filter_crs")
     def validate_filter_crs(cls, filter_crs):
-        if filter_crs:
-            crs_extension = CrsExtension()
-            if filter_crs in crs_extension.crs:
-                return filter_crs
-            else:
-                raise ValidationError(
-                    [
-                        ErrorWrapper(
-                            ValueError(
-                                f"'{filter_crs}' is not a supported filter-crs. Currently supported crs are: {crs_extension.crs}"
-                            ),
-                            "STACSearch",
-                        )
-                    ],
-                    STACSearch,
-                )
+        return _validate_one_crs(filter_crs, "filter-crs")
 
     # Override the bbox validator because it only works for WGS84
     @validator("bbox")
@@ -394,24 +388,22 @@ class STACSearch(BaseModel):
             raise ValueError("intersects and bbox parameters are mutually exclusive")
 
         if v:
-            # Validate order
-            if len(v) == 4:
-                xmin, ymin, xmax, ymax = v
-            else:
-                xmin, ymin, min_elev, xmax, ymax, max_elev = v
-                if max_elev < min_elev:
-                    raise ValueError(
-                        "Maximum elevation must greater than minimum elevation"
-                    )
-
-            if xmax < xmin:
+            # Validate order, the maximum corner starts halfway (xmin, ymin[, min_elev], xmax, ymax[, max_elev])
+            n = len(v)
+            if n not in (4, 6):
+                raise ValueError("bbox must have 4 or 6 values")
+            half = n // 2
+            if v[half] < v[0]:
                 raise ValueError(
                     "Maximum longitude must be greater than minimum longitude"
                 )
-
-            if ymax < ymin:
+            if v[half + 1] < v[1]:
                 raise ValueError(
-                    "Maximum longitude must be greater than minimum longitude"
+                    "Maximum latitude must be greater than minimum latitude"
+                )
+            if n == 6 and v[5] < v[2]:
+                raise ValueError(
+                    "Maximum elevation must greater than minimum elevation"
                 )
 
             # Validate against WGS84
@@ -427,124 +419,92 @@ class STACSearch(BaseModel):
         if "filter" in values and values["filter"]:
             # Validate filter-lang
             if "filter_lang" in values and values["filter_lang"] != "cql-json":
-                raise ValidationError(
-                    [
-                        ErrorWrapper(
-                            ValueError(
-                                f"'{values['filter_lang']}' is not a supported filter-language. Currently supported languages are: cql-json"
-                            ),
-                            "STACSearch",
-                        )
-                    ],
-                    STACSearch,
+                raise ValueError(
+                    f"'{values['filter_lang']}' is not a supported filter-language. Currently supported languages are: cql-json"
                 )
 
             # Validate filter-crs
             if "filter_crs" in values and values["filter_crs"]:
-                crs_extension = CrsExtension()
-                if values["filter_crs"] in crs_extension.crs:
+                if values["filter_crs"] in _CRS_TO_SRID:
                     # Convert the URI crs to a SRID
-                    values["filter_crs"] = crs_extension.epsg_from_crs(
-                        values["filter_crs"]
-                    )
-                elif values["filter_crs"] in [
-                    str(crs_extension.epsg_from_crs(x)) for x in crs_extension.crs
-                ]:
+                    values["filter_crs"] = _CRS_TO_SRID[values["filter_crs"]]
+                elif values["filter_crs"] in _SRID_SET:
                     values["filter_crs"] = int(values["filter_crs"])
                 else:
                     # SRID was given
-                    raise ValidationError(
-                        [
-                            ErrorWrapper(
-                                ValueError(
-                                    f"filter-crs must be a supported CRS. Currently supported crs are:\n"
-                                    + ",\n".join(crs_extension.crs)
-                                    + "\n"
-                                ),
-                                "STACSearch",
-                            )
-                        ],
-                        STACSearch,
+                    raise ValueError(
+                        f"filter-crs must be a supported CRS. Currently supported crs are:\n"
+                        + ",\n".join(_CRS_EXTENSION.crs)
+                        + "\n"
                     )
                 # add filter-crs to filter if crs is not 4326 - hack in order to pass crs to pygeofilter through the geojson
                 if values["filter_crs"] != 4326:
                     cls.add_filter_crs(values["filter"], values["filter_crs"])
 
-            # Validate filter
+            # Validate filter. The key is dumped after filter-crs was added, so the crs is part of it
             try:
-                ast = parse_json(values["filter"])  # pygeofilter cql-json parse
-            except Exception as e:
-                raise ValidationError(
-                    [
-                        ErrorWrapper(
-                            ValueError(f"The input cql-json could not be parsed"),
-                            "STACSearch",
-                        )
-                    ],
-                    STACSearch,
-                )
-            if not ast:
-                raise ValidationError(
-                    [
-                        ErrorWrapper(
-                            ValueError(f"The input cql-json could not be parsed"),
-                            "STACSearch",
-                        )
-                    ],
-                    STACSearch,
-                )
-            if "collections" in values and values["collections"]:
-                (
-                    base_queryables,
-                    collection_queryables,
-                ) = Queryables.get_queryable_properties_intersection(
-                    values["collections"]
-                )
-                valid_fields = base_queryables + collection_queryables
-            else:
-                (
-                    base_queryables,
-                    collection_queryables,
-                ) = Queryables.get_queryable_properties_intersection()
-                valid_fields = base_queryables + collection_queryables
-
-            # full list of operations supported in pygeofiler
-            valid_ops = {
-                **pgf_cql_json.parser.COMPARISON_MAP,
-                **pgf_cql_json.parser.SPATIAL_PREDICATES_MAP,
-                **pgf_cql_json.parser.TEMPORAL_PREDICATES_MAP,
-                # **pgf_cql_json.parser.ARRAY_PREDICATES_MAP,
-                **pgf_cql_json.parser.ARITHMETIC_MAP,
-            }
-            remove_ops = []  # operations we don't want to expose eg. ["meets", "metby"]
-            for op in remove_ops:
-                if op in valid_ops:
-                    del valid_ops[op]
-            values["filter_fields"] = cls.validate_filter_fields(ast, valid_fields)
-            cls.validate_filter_ops(ast, valid_ops)
+                filter_key = orjson.dumps(values["filter"], option=orjson.OPT_SORT_KEYS)
+            except TypeError:
+                raise ValueError(f"The input cql-json could not be parsed")
+            collections = tuple(sorted(set(values.get("collections") or ())))
+            ast, filter_fields = cls._parse_and_validate(filter_key, collections)
+            values["filter_fields"] = list(filter_fields)
             values["filter"] = ast
 
         return values
 
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_and_validate(
+        cls, filter_key: bytes, collections: Tuple[str, ...]
+    ) -> Tuple[Any, Tuple[str, ...]]:
+        """Parse and validate a cql-json filter, returning the ast and the fields it uses.
+
+        Paging repeats the same filter, so results are cached. The ast is parsed from `filter_key`
+        and never shared with the request, callers must not modify it.
+        """
+        try:
+            ast = parse_json(orjson.loads(filter_key))  # pygeofilter cql-json parse
+        except Exception as e:
+            raise ValueError(f"The input cql-json could not be parsed")
+        if not ast:
+            raise ValueError(f"The input cql-json could not be parsed")
+        _, collection_queryables = Queryables.get_queryable_properties_intersection(
+            collections
+        )
+        valid_fields = Queryables._base_queryable_set.union(collection_queryables)
+
+        filter_fields = cls.validate_filter_fields(ast, valid_fields)
+        cls.validate_filter_ops(ast, _DEFAULT_VALID_OPS)
+        return ast, tuple(filter_fields)
+
     # from stac_pydantic.api.Search
     @property
     def start_date(self) -> Optional[datetime]:
-        values = self.datetime.split("/")
-        if len(values) == 1:
-            return None
-        if values[0] == ".." or values[0] == "":
+        if "/" not in self.datetime:
             return None
-        return parse_datetime(values[0])
+        return self.datetime_interval[0]
 
     # from stac_pydantic.api.Search
     @property
     def end_date(self) -> Optional[datetime]:
-        values = self.datetime.split("/")
-        if len(values) == 1:
-            return parse_datetime(values[0])
-        if values[1] == ".." or values[1] == "":
-            return None
-        return parse_datetime(values[1])
+        return self.datetime_interval[1]
+
+    @property
+    def datetime_interval(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Parsed (start, end) of `datetime`, parsed once per request.
+
+        Open ends are None and a single datetime gives the same start and end.
+        """
+        if self._datetime_interval is None:
+            bounds = []
+            for value in self.datetime.split("/") if self.datetime else ("..", ".."):
+                if value == ".." or value == "":
+                    bounds.append(None)
+                else:
+                    bounds.append(_parse_datetime(value.replace("z", "Z").replace("t", "T")))
+            self._datetime_interval = (bounds[0], bounds[-1])
+        return self._datetime_interval
 
     # from stac_pydantic.api.Search
     @validator("intersects")
@@ -571,11 +531,11 @@ class STACSearch(BaseModel):
             # syntax may alternatively be lower case "t" or "z" respectively.
             # So we have to replace "t" and "z" with their uppercase counterparts.
             value = value.replace("z", "Z").replace("t", "T")
-            parse_datetime(value)
+            _parse_datetime(value)
             dates.append(value)
 
         if ".." not in dates:
-            if parse_datetime(dates[0]) > parse_datetime(dates[1]):
+            if _parse_datetime(dates[0]) > _parse_datetime(dates[1]):
                 raise ValueError(
                     "Invalid datetime range, must match format (begin_date, end_date)"
                 )
@@ -590,17 +550,23 @@ class STACSearch(BaseModel):
         Check for both because the ``bbox`` and ``intersects`` parameters are mutually exclusive.
         """
         if self.bbox:
-            return Polygon(
-                coordinates=[
-                    [
-                        [self.bbox[0], self.bbox[3]],
-                        [self.bbox[2], self.bbox[3]],
-                        [self.bbox[2], self.bbox[1]],
-                        [self.bbox[0], self.bbox[1]],
-                        [self.bbox[0], self.bbox[3]],
-                    ]
-                ]
-            )
+            if self._bbox_polygon is None:
+                half = len(self.bbox) // 2
+                xmin, ymin = self.bbox[0], self.bbox[1]
+                xmax, ymax = self.bbox[half], self.bbox[half + 1]
+                self._bbox_polygon = Polygon(
+                    type="Polygon",
+                    coordinates=[
+                        [
+                            [xmin, ymax],
+                            [xmax, ymax],
+                            [xmax, ymin],
+                            [xmin, ymin],
+                            [xmin, ymax],
+                        ]
+                    ],
+                )
+            return self._bbox_polygon
         if self.intersects:
             return self.intersects
         return
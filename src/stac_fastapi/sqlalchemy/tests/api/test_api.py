@@ -1,6 +1,9 @@
+import asyncio
 from datetime import datetime, timedelta
+from decimal import Decimal
 import json
 import pytest
+from stac_fastapi.api.models import GeoJSONStreamingResponse
 from ..conftest import TEST_COLLECTION_ID, MockStarletteRequest
 from stac_fastapi.sqlalchemy.config import (
     SkraafotosProperties,
@@ -359,3 +362,57 @@ def test_app_path_allowing_token_should_return_links_with_token(
             resp = token_app_client.post(path, json={}, params=params)
         assert resp.status_code == 200
         assert b"token=TESTTOKEN" in resp.content
+
+
+def _streamed_body(content):
+    """Collect the body of a streamed FeatureCollection response"""
+    response = GeoJSONStreamingResponse(content)
+
+    async def collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(collect())
+
+
+def test_streamed_feature_collection():
+    features = [
+        {"type": "Feature", "id": "a", "properties": {"gsd": Decimal("0.1")}},
+        {"type": "Feature", "id": "b", "properties": {}},
+    ]
+    content = {
+        "type": "FeatureCollection",
+        "features": iter(features),
+        "links": [{"rel": "self", "href": "http://test-server/search"}],
+        "context": {"returned": 2, "limit": 10, "matched": 2},
+    }
+    body = json.loads(_streamed_body(content))
+
+    # links and context are written after the features
+    assert list(body) == ["type", "features", "links", "context"]
+    assert [feat["id"] for feat in body["features"]] == ["a", "b"]
+    assert body["features"][0]["properties"]["gsd"] == 0.1
+    assert body["links"] == content["links"]
+    assert body["context"] == content["context"]
+
+
+def test_streamed_feature_collection_batches():
+    """Features in more than one chunk are separated the same way as within a chunk"""
+    content = {
+        "type": "FeatureCollection",
+        "features": [{"type": "Feature", "id": str(i)} for i in range(250)],
+    }
+    body = json.loads(_streamed_body(content))
+
+    assert [feat["id"] for feat in body["features"]] == [str(i) for i in range(250)]
+
+
+def test_streamed_feature_collection_empty_and_none_members():
+    content = {
+        "type": "FeatureCollection",
+        "features": [],
+        "links": [],
+        "context": None,
+    }
+    body = json.loads(_streamed_body(content))
+
+    assert body == {"type": "FeatureCollection", "features": [], "links": []}
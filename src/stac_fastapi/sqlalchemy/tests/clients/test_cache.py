@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stac_fastapi.sqlalchemy import cache
+from stac_fastapi.sqlalchemy.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", fake)
+    return fake
+
+
+def test_cache_returns_cached_value(clock):
+    ttl_cache = TTLCache(ttl=60)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return len(calls)
+
+    assert ttl_cache.get_or_set("key", factory) == 1
+    assert ttl_cache.get_or_set("key", factory) == 1
+    assert len(calls) == 1
+
+
+def test_cache_entry_expires(clock):
+    ttl_cache = TTLCache(ttl=60)
+    ttl_cache.get_or_set("key", lambda: "old")
+
+    clock.now += 59
+    assert ttl_cache.get_or_set("key", lambda: "new") == "old"
+    clock.now += 1
+    assert ttl_cache.get_or_set("key", lambda: "new") == "new"
+
+
+def test_cache_ttl_0_disables_cache(clock):
+    ttl_cache = TTLCache(ttl=0)
+    values = iter(range(3))
+
+    assert [ttl_cache.get_or_set("key", lambda: next(values)) for _ in range(3)] == [
+        0,
+        1,
+        2,
+    ]
+    assert not ttl_cache._entries
+
+
+def test_cache_evicts_expired_entries_first(clock):
+    ttl_cache = TTLCache(ttl=60, maxsize=2)
+    ttl_cache.get_or_set("a", lambda: "a")
+    clock.now += 30
+    ttl_cache.get_or_set("b", lambda: "b")
+    clock.now += 30  # "a" has expired, "b" has not
+
+    ttl_cache.get_or_set("c", lambda: "c")
+    assert list(ttl_cache._entries) == ["b", "c"]
+
+
+def test_cache_evicts_oldest_entry_when_full(clock):
+    ttl_cache = TTLCache(ttl=60, maxsize=2)
+    for key in ("a", "b", "c"):
+        ttl_cache.get_or_set(key, lambda: key)
+
+    assert list(ttl_cache._entries) == ["b", "c"]
+    assert ttl_cache.get_or_set("a", lambda: "new a") == "new a"
+
+
+def test_cache_concurrent_inserts():
+    ttl_cache = TTLCache(ttl=60, maxsize=8)
+
+    def insert(i):
+        return ttl_cache.get_or_set(i % 64, lambda: i % 64)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(insert, range(10000)))
+
+    assert results == [i % 64 for i in range(10000)]
+    assert len(ttl_cache._entries) <= 8
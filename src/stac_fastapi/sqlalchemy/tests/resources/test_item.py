@@ -550,6 +550,56 @@ def test_pagination_token_idempotent(app_client, load_test_data):
     ]
 
 
+def test_pagination_context_matched_get(app_client, load_test_data):
+    """Test that every page reports the same number of matched items (context extension)"""
+    test_item = load_test_data("test_item.json")
+    page = app_client.get(
+        "/search", params={"collections": test_item["collection"], "limit": 1}
+    )
+    page_data = page.json()
+    matched = page_data["context"]["matched"]
+    assert matched > 2
+
+    for _ in range(2):
+        next_link = list(filter(lambda l: l["rel"] == "next", page_data["links"]))
+        page = app_client.get(
+            "/search", params=parse_qs(urlparse(next_link[0]["href"]).query)
+        )
+        page_data = page.json()
+        assert page_data["context"]["returned"] == 1
+        assert page_data["context"]["matched"] == matched
+
+
+def test_pagination_context_matched_post(app_client, load_test_data):
+    """Test that every POST page reports the same number of matched items (context extension)"""
+    test_item = load_test_data("test_item.json")
+    request_body = {"collections": [test_item["collection"]], "limit": 1}
+    page_data = app_client.post("/search", json=request_body).json()
+    matched = page_data["context"]["matched"]
+    assert matched > 2
+
+    for _ in range(2):
+        next_link = list(filter(lambda l: l["rel"] == "next", page_data["links"]))
+        request_body.update(next_link[0]["body"])
+        page_data = app_client.post("/search", json=request_body).json()
+        assert page_data["context"]["matched"] == matched
+
+
+def test_context_matched_empty_page(app_client, load_test_data):
+    """Test that a search without results reports 0 matched items (context extension)"""
+    test_item = load_test_data("test_item.json")
+    params = {
+        "collections": test_item["collection"],
+        "datetime": "1900-01-01T00:00:00Z/1900-01-02T00:00:00Z",
+    }
+    resp = app_client.get("/search", params=params)
+    assert resp.status_code == 200
+    resp_json = resp.json()
+    assert resp_json["features"] == []
+    assert resp_json["context"]["returned"] == 0
+    assert resp_json["context"]["matched"] == 0
+
+
 @pytest.mark.skip(reason="FieldExtension switched off")
 def test_field_extension_get(app_client, load_test_data):
     """Test GET search with included fields (fields extension)"""
@@ -752,6 +802,18 @@ def test_search_bbox_errors(app_client):
     params = {"bbox": "100.0,0.0,0.0,105.0"}
     resp = app_client.get("/search", params=params)
     assert resp.status_code == 400
+
+
+def test_search_bbox_not_numbers(app_client, load_test_data):
+    test_item = load_test_data("test_item.json")
+    params = {"bbox": "a,b,c,d"}
+    resp = app_client.get("/search", params=params)
+    assert resp.status_code == 400
+
+    resp = app_client.get(
+        f"/collections/{test_item['collection']}/items", params=params
+    )
+    assert resp.status_code == 400
     
     
 def test_filter_crs_in_epsg25832_should_not_affect_bbox_in_epsg4326(app_client, load_test_data):
@@ -0,0 +1,111 @@
+import pytest
+from pydantic import ValidationError
+from pygeofilter.backends.sqlalchemy import to_filter
+from sqlalchemy.dialects import postgresql
+
+from stac_fastapi.sqlalchemy.core import CoreCrudClient, get_geometry_filter
+from stac_fastapi.sqlalchemy.types.search import FieldsExtension, STACSearch
+
+DATETIME = "2021-01-01T00:00:00Z/.."
+
+
+@pytest.mark.parametrize(
+    "bbox",
+    [
+        [10.0, 55.0, 11.0, 56.0],
+        [10.0, 55.0, -5.0, 11.0, 56.0, 100.0],
+    ],
+)
+def test_spatial_filter_bbox_polygon(bbox):
+    search = STACSearch(bbox=bbox, datetime=DATETIME)
+
+    polygon = search.spatial_filter
+    assert polygon.type == "Polygon"
+    assert [list(coord) for coord in polygon.coordinates[0]] == [
+        [10.0, 56.0],
+        [11.0, 56.0],
+        [11.0, 55.0],
+        [10.0, 55.0],
+        [10.0, 56.0],
+    ]
+    # Built once per search
+    assert search.spatial_filter is polygon
+
+
+def test_spatial_filter_without_bbox():
+    assert STACSearch(datetime=DATETIME).spatial_filter is None
+
+
+def _filter_sql(search):
+    """The SQL and parameters of a search filter, built the way post_search does"""
+    get_geometry_filter(search.filter)
+    compiled = to_filter(search.filter, CoreCrudClient.FIELD_MAPPING).compile(
+        dialect=postgresql.dialect()
+    )
+    return str(compiled), compiled.params
+
+
+def test_cached_filter_gives_same_sql():
+    def search(**kwargs):
+        # A new filter dict each time, as for separate requests
+        cql = {
+            "and": [
+                {"gt": [{"property": "gsd"}, 0.1]},
+                {
+                    "intersects": [
+                        {"property": "geometry"},
+                        {"type": "Point", "coordinates": [600000, 6200000]},
+                    ]
+                },
+            ]
+        }
+        return STACSearch(filter=cql, datetime=DATETIME, **kwargs)
+
+    epsg25832 = {"filter-crs": "http://www.opengis.net/def/crs/EPSG/0/25832"}
+    first_25832 = search(**epsg25832)
+    sql_25832 = _filter_sql(first_25832)
+    sql_crs84 = _filter_sql(search())
+    assert sql_25832 != sql_crs84
+    assert sql_25832[1]["ST_GeomFromText_2"] == 25832
+    assert sql_crs84[1]["ST_GeomFromText_2"] == 4326
+
+    again_25832 = search(**epsg25832)
+    assert again_25832.filter is first_25832.filter
+    assert _filter_sql(again_25832) == sql_25832
+    assert _filter_sql(search()) == sql_crs84
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["properties", "properties.gsd"],
+        ["properties.gsd", "properties"],
+    ],
+)
+def test_field_dict_whole_field_overrides_nested(fields):
+    """A whole field wins over selected keys of it, whatever the order"""
+    field_dict = FieldsExtension._get_field_dict(fields)
+    assert field_dict == {"properties": ...}
+
+
+def test_field_dict_nested_and_flat():
+    field_dict = FieldsExtension._get_field_dict(
+        {"id", "properties.gsd", "properties.datetime"}
+    )
+    assert field_dict == {"id": ..., "properties": {"gsd", "datetime"}}
+    assert FieldsExtension._get_field_dict(None) == {}
+
+
+@pytest.mark.parametrize(
+    "bbox, message",
+    [
+        ([11.0, 55.0, 10.0, 56.0], "Maximum longitude must be greater than minimum longitude"),
+        ([10.0, 56.0, 11.0, 55.0], "Maximum latitude must be greater than minimum latitude"),
+        ([10.0, 56.0, 0.0, 11.0, 55.0, 10.0], "Maximum latitude must be greater than minimum latitude"),
+    ],
+)
+def test_bbox_order_errors(bbox, message):
+    with pytest.raises(ValidationError) as exc_info:
+        STACSearch(bbox=bbox, datetime=DATETIME)
+    errors = exc_info.value.errors()
+    assert [(error["loc"], error["msg"]) for error in errors] == [(("bbox",), message)]
@@ -16,6 +16,9 @@ class ApiSettings(BaseSettings):
         indexed_fields:
             set of fields which are usually in `item.properties` but are indexed as distinct columns in
             the database.
+        enable_response_models:
+            include response models in the OpenAPI schema. Responses are documented only, they are never
+            validated against the models.
     """
 
     # TODO: Remove `default_includes` attribute so we can use `pydantic.BaseSettings` instead